@@ -14,18 +14,23 @@ All communication goes through the Decision Orchestrator.
 All agent outputs are structured JSON.
 """
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from datetime import date, datetime
-from typing import Optional, Any
+from typing import Optional, Any, AsyncIterator, Callable, TypedDict
+from operator import attrgetter
+from types import MappingProxyType
 from pydantic import BaseModel, Field
-import json
+import asyncio
+import os
 
 from .models import AgentResponse, ChatResponse, FarmerDB, FarmDB, CropDB
-from .utils.weather import fetch_weather, assess_farming_impact, WeatherData, FarmingImpact
+from .utils.weather import get_weather, prefetch_weather, assess_farming_impact, forecast_stats, WeatherData, FarmingImpact
 from .utils.gdd import estimate_gdd_from_average, GDDResult
 from .utils.crop_data import (
     get_crop_info, get_current_stage, get_stage_progress,
     get_risk_rules, CropStageInfo
 )
+from .llm_service import get_llm_service, _LANGUAGE_SCRIPTS, _compile_intent_patterns
 
 
 # ============== BASE AGENT ==============
@@ -54,10 +59,20 @@ class BaseAgent(ABC):
 
 # ============== WEATHER INTELLIGENCE AGENT ==============
 
+# Static error responses are built once and shared; callers only read them
+_NO_LOCATION = AgentResponse.model_construct(
+    result={"error": "Location not set"},
+    confidence=0.0,
+    reasoning="Weather data is unavailable because your location is not set in your profile. Please update your location in the Profile settings.",
+    data_sources=[]
+)
+
+
 class WeatherAgent(BaseAgent):
     """
     Fetches weather data and converts to farming impact.
-    Uses Open-Meteo API (free, no API key).
+    Uses Open-Meteo API (free, no API key), read through the shared
+    get_weather cache.
     """
     
     name = "WeatherIntelligenceAgent"
@@ -72,60 +87,52 @@ class WeatherAgent(BaseAgent):
         lon = context.get("longitude")
         
         if not lat or not lon:
-            return AgentResponse(
-                result={"error": "Location not set"},
-                confidence=0.0,
-                reasoning="Weather data is unavailable because your location is not set in your profile. Please update your location in the Profile settings.",
-                data_sources=[]
-            )
+            return _NO_LOCATION
         
         try:
-            weather = await fetch_weather(lat, lon)
+            weather = await get_weather(lat, lon)
             impact = assess_farming_impact(weather)
-            
-            return AgentResponse(
-                result={
-                    "current": {
-                        "temperature": weather.current.temperature,
-                        "humidity": weather.current.humidity,
-                        "precipitation": weather.current.precipitation,
-                        "condition": weather.current.condition.value,
-                        "wind_speed": weather.current.wind_speed
-                    },
-                    "forecast_3day": [
-                        {
-                            "date": f.date.isoformat(),
-                            "temp_max": f.temp_max,
-                            "temp_min": f.temp_min,
-                            "precipitation": f.precipitation_sum,
-                            "rain_probability": f.precipitation_probability
-                        }
-                        for f in weather.forecast_7day[:3]
-                    ],
-                    "farming_impact": {
-                        "rain_risk": impact.rain_risk,
-                        "heat_stress_risk": impact.heat_stress_risk,
-                        "cold_stress_risk": impact.cold_stress_risk,
-                        "spray_safe": impact.spray_safe,
-                        "irrigation_needed": impact.irrigation_needed,
-                        "field_work_safe": impact.field_work_safe
-                    }
-                },
-                confidence=0.9,
-                reasoning=impact.reasoning,
-                data_sources=["open-meteo"]
-            )
         except Exception as e:
-            return AgentResponse(
+            return AgentResponse.model_construct(
                 result={"error": str(e)},
                 confidence=0.0,
                 reasoning=f"Weather fetch failed: {str(e)}",
                 data_sources=[]
             )
+        
+        payload = weather.to_agent_payload()
+        return AgentResponse.model_construct(
+            result={
+                "current": payload["current"],
+                "forecast_3day": payload["forecast_3day"],
+                "forecast_stats": payload["forecast_stats"],
+                "farming_impact": impact.model_dump(exclude={"reasoning"})
+            },
+            confidence=0.9,
+            reasoning=impact.reasoning,
+            data_sources=["open-meteo"]
+        )
+    
+    def prefetch(self, lat: Optional[float], lon: Optional[float]):
+        """
+        Start fetching weather for a location without waiting for it.
+        A later execute() for the same location joins the running fetch
+        or reads the cached result.
+        """
+        if lat and lon:
+            prefetch_weather(lat, lon)
 
 
 # ============== CROP STAGE PREDICTION AGENT ==============
 
+_MISSING_CROP_INFO = AgentResponse.model_construct(
+    result={"error": "Crop type and sowing date required"},
+    confidence=0.0,
+    reasoning="Missing required crop information",
+    data_sources=[]
+)
+
+
 class CropStageAgent(BaseAgent):
     """
     Determines current crop growth stage using GDD calculation.
@@ -138,76 +145,208 @@ class CropStageAgent(BaseAgent):
         """
         Calculate crop stage based on GDD.
         
-        Context requires: crop_type, sowing_date, weather_data (or avg temps)
+        Context requires: crop_type, sowing_date, weather_data (or avg temps);
+        optional today (defaults to date.today())
         """
         crop_type = context.get("crop_type")
         sowing_date = context.get("sowing_date")
         weather = context.get("weather_data")
         
         if not crop_type or not sowing_date:
-            return AgentResponse(
-                result={"error": "Crop type and sowing date required"},
-                confidence=0.0,
-                reasoning="Missing required crop information",
-                data_sources=[]
-            )
+            return _MISSING_CROP_INFO
         
-        # Convert sowing_date if string
+        # Convert sowing_date if string (ContextAgent emits ISO dates)
         if isinstance(sowing_date, str):
             sowing_date = date.fromisoformat(sowing_date)
         
+        today = context.get("today") or date.today()
+        
         # Estimate GDD using weather data or averages
-        if weather and "forecast_3day" in weather:
-            forecasts = weather["forecast_3day"]
-            avg_max = sum(f["temp_max"] for f in forecasts) / len(forecasts)
-            avg_min = sum(f["temp_min"] for f in forecasts) / len(forecasts)
+        if weather and weather.get("forecast_3day"):
+            stats = weather.get("forecast_stats") or forecast_stats(weather["forecast_3day"])
+            avg_max = stats["avg_temp_max"]
+            avg_min = stats["avg_temp_min"]
         else:
             # Use reasonable defaults for tropical climate
             avg_max = 32.0
             avg_min = 22.0
         
-        gdd_result = estimate_gdd_from_average(
-            sowing_date, avg_max, avg_min, crop_type
-        )
-        
-        # Get stage information
-        progress = get_stage_progress(crop_type, gdd_result.accumulated_gdd)
-        crop_info = get_crop_info(crop_type)
-        
-        if not progress:
-            return AgentResponse(
-                result={"error": f"Unknown crop type: {crop_type}"},
-                confidence=0.5,
-                reasoning=f"Crop '{crop_type}' not in knowledge base, using defaults",
-                data_sources=["gdd_calculation"]
-            )
-        
-        days_since_sowing = (date.today() - sowing_date).days
-        
-        return AgentResponse(
-            result={
-                "crop_type": crop_type,
-                "sowing_date": sowing_date.isoformat(),
-                "days_since_sowing": days_since_sowing,
-                "accumulated_gdd": gdd_result.accumulated_gdd,
-                "current_stage": progress.get("current_stage"),
-                "stage_description": progress.get("stage_description"),
-                "stage_progress": progress.get("stage_progress"),
-                "overall_progress": progress.get("overall_progress"),
-                "water_need": progress.get("water_need"),
-                "nutrient_need": progress.get("nutrient_need"),
-                "heat_sensitive": progress.get("heat_sensitive", False),
-                "critical_temp_max": progress.get("critical_temp_max"),
-                "gdd_to_next_stage": progress.get("gdd_to_next_stage")
-            },
-            confidence=0.85,
-            reasoning=f"Stage calculated using {gdd_result.accumulated_gdd:.0f} GDD over {days_since_sowing} days",
-            data_sources=["gdd_calculation", "crop_knowledge_base"]
+        return _crop_stage_response(crop_type, sowing_date, today, avg_max, avg_min)
+
+
+def _crop_stage_response(
+    crop_type: str,
+    sowing_date: date,
+    today: date,
+    avg_max: float,
+    avg_min: float
+) -> AgentResponse:
+    """
+    Stage calculation behind CropStageAgent.execute(), as a new
+    AgentResponse per call so callers may modify it.
+    """
+    result, confidence, reasoning, data_sources = _crop_stage(
+        crop_type, sowing_date, today, avg_max, avg_min
+    )
+    return AgentResponse.model_construct(
+        result=dict(result),
+        confidence=confidence,
+        reasoning=reasoning,
+        data_sources=list(data_sources)
+    )
+
+
+@lru_cache(maxsize=4096)
+def _crop_stage(
+    crop_type: str,
+    sowing_date: date,
+    today: date,
+    avg_max: float,
+    avg_min: float
+) -> tuple[MappingProxyType, float, str, tuple[str, ...]]:
+    """
+    (result, confidence, reasoning, data_sources) for a crop stage.
+    Deterministic in its arguments, so repeat questions about the same crop
+    on the same day and forecast reuse the result. Cached values are
+    read-only and only hold scalars.
+    """
+    gdd_result = estimate_gdd_from_average(
+        sowing_date, avg_max, avg_min, crop_type, current_date=today
+    )
+    
+    # Get stage information
+    progress = get_stage_progress(crop_type, gdd_result.accumulated_gdd)
+    
+    if not progress:
+        return (
+            MappingProxyType({"error": f"Unknown crop type: {crop_type}"}),
+            0.5,
+            f"Crop '{crop_type}' not in knowledge base, using defaults",
+            ("gdd_calculation",)
         )
+    
+    days_since_sowing = (today - sowing_date).days
+    
+    return (
+        MappingProxyType({
+            "crop_type": crop_type,
+            "sowing_date": sowing_date.isoformat(),
+            "days_since_sowing": days_since_sowing,
+            "accumulated_gdd": gdd_result.accumulated_gdd,
+            "current_stage": progress.get("current_stage"),
+            "stage_description": progress.get("stage_description"),
+            "stage_progress": progress.get("stage_progress"),
+            "overall_progress": progress.get("overall_progress"),
+            "water_need": progress.get("water_need"),
+            "nutrient_need": progress.get("nutrient_need"),
+            "heat_sensitive": progress.get("heat_sensitive", False),
+            "critical_temp_max": progress.get("critical_temp_max"),
+            "gdd_to_next_stage": progress.get("gdd_to_next_stage")
+        }),
+        0.85,
+        f"Stage calculated using {gdd_result.accumulated_gdd:.0f} GDD over {days_since_sowing} days",
+        ("gdd_calculation", "crop_knowledge_base")
+    )
 
 
 # ============== RISK ASSESSMENT AGENT ==============
 
+# Crop stages each risk rule applies to
+_HEAT_STAGES = frozenset({"flowering", "silking", "tasseling"})
+_RAIN_FLOWER_STAGES = frozenset({"flowering", "silking", "pollination"})
+_MATURITY_STAGES = frozenset({"maturity", "grain_filling", "boll_opening"})
+_SEEDLING_STAGES = frozenset({"germination", "seedling"})
+_VEGETATIVE_STAGES = frozenset({"vegetative"})
+
+
+def _rule_flowering_heat(ctx: dict, risks: list, alerts: list):
+    """Rule 1: Flowering + Heat."""
+    critical_temp = ctx["critical_temp"]
+    if not (ctx["heat_sensitive"] and critical_temp):
+        return
+    
+    temp = ctx["temp"]
+    current_stage = ctx["current_stage"]
+    if temp > critical_temp:
+        risks.append({
+            "type": "heat_stress",
+            "severity": "high",
+            "message": f"Critical heat stress! Temperature ({temp}°C) exceeds safe limit ({critical_temp}°C) during {current_stage}",
+            "action": "Irrigate during hottest hours for cooling effect. Avoid field work 11am-3pm."
+        })
+        alerts.append(f"⚠️ Heat Alert: {temp}°C dangerous for {current_stage}")
+    elif ctx["max_temp_max"] > critical_temp:
+        risks.append({
+            "type": "heat_forecast",
+            "severity": "medium",
+            "message": f"Heat stress expected in coming days during critical {current_stage} stage",
+            "action": "Prepare for irrigation. Monitor temperatures closely."
+        })
+
+
+def _rule_flowering_rain(ctx: dict, risks: list, alerts: list):
+    """Rule 2: Flowering + Rain."""
+    max_rain_prob = ctx["max_rain_prob"]
+    if max_rain_prob > 70:
+        risks.append({
+            "type": "rain_during_flowering",
+            "severity": "medium",
+            "message": f"Rain expected ({max_rain_prob}% probability) during flowering may affect pollination",
+            "action": "Monitor for disease after rain. Flowering timing may affect yield."
+        })
+
+
+def _rule_maturity_rain(ctx: dict, risks: list, alerts: list):
+    """Rule 3: Maturity + Rain."""
+    total_rain = ctx["total_rain"]
+    if total_rain > 20:
+        risks.append({
+            "type": "rain_during_maturity",
+            "severity": "high",
+            "message": f"Heavy rain ({total_rain:.0f}mm) expected during {ctx['current_stage']}. Risk of grain damage.",
+            "action": "Consider early harvest if crop is ready. Inspect for fungal issues after rain."
+        })
+        alerts.append(f"🌧️ Rain Alert: {total_rain:.0f}mm expected - protect mature crop")
+
+
+def _rule_seedling_cold(ctx: dict, risks: list, alerts: list):
+    """Rule 4: Seedling + Cold."""
+    if ctx["min_temp_min"] < 10:
+        risks.append({
+            "type": "cold_stress_seedling",
+            "severity": "medium",
+            "message": "Cold temperatures may slow seedling growth",
+            "action": "Provide mulch or protective covering if possible."
+        })
+
+
+def _rule_vegetative_drought(ctx: dict, risks: list, alerts: list):
+    """Rule 5: Vegetative drought (rainfed)."""
+    if ctx["irrigation_type"] != "rainfed":
+        return
+    
+    if ctx["farming_impact"].get("irrigation_needed", False) and ctx["max_rain_prob"] <= 50:
+        risks.append({
+            "type": "drought_stress",
+            "severity": "medium",
+            "message": "Drought conditions during vegetative growth may limit yield potential",
+            "action": "Irrigate if possible. Consider foliar spray to reduce water stress."
+        })
+
+
+# Crop stage -> rules to evaluate, in rule order
+_STAGE_RULES: dict[str, tuple[Callable[[dict, list, list], None], ...]] = {}
+for _stages, _rule in (
+    (_HEAT_STAGES, _rule_flowering_heat),
+    (_RAIN_FLOWER_STAGES, _rule_flowering_rain),
+    (_MATURITY_STAGES, _rule_maturity_rain),
+    (_SEEDLING_STAGES, _rule_seedling_cold),
+    (_VEGETATIVE_STAGES, _rule_vegetative_drought),
+):
+    for _stage in _stages:
+        _STAGE_RULES[_stage] = _STAGE_RULES.get(_stage, ()) + (_rule,)
+
+
 class RiskAssessmentAgent(BaseAgent):
     """
     Identifies upcoming threats based on crop stage + weather.
@@ -224,92 +363,43 @@ class RiskAssessmentAgent(BaseAgent):
         """
         crop_stage = context.get("crop_stage_data", {})
         weather = context.get("weather_data", {})
-        irrigation_type = context.get("irrigation_type", "rainfed")
         
         risks = []
         alerts = []
         
         current_stage = crop_stage.get("current_stage", "")
-        heat_sensitive = crop_stage.get("heat_sensitive", False)
-        critical_temp = crop_stage.get("critical_temp_max")
+        rules = _STAGE_RULES.get(current_stage, ())
         
-        # Weather conditions
-        current = weather.get("current", {})
-        temp = current.get("temperature", 25)
-        forecast = weather.get("forecast_3day", [])
-        farming_impact = weather.get("farming_impact", {})
-        
-        # Rule 1: Flowering + Heat
-        if current_stage in ["flowering", "silking", "tasseling"]:
-            if heat_sensitive and critical_temp:
-                if temp > critical_temp:
-                    risks.append({
-                        "type": "heat_stress",
-                        "severity": "high",
-                        "message": f"Critical heat stress! Temperature ({temp}°C) exceeds safe limit ({critical_temp}°C) during {current_stage}",
-                        "action": "Irrigate during hottest hours for cooling effect. Avoid field work 11am-3pm."
-                    })
-                    alerts.append(f"⚠️ Heat Alert: {temp}°C dangerous for {current_stage}")
-                elif any(f.get("temp_max", 0) > critical_temp for f in forecast):
-                    risks.append({
-                        "type": "heat_forecast",
-                        "severity": "medium",
-                        "message": f"Heat stress expected in coming days during critical {current_stage} stage",
-                        "action": "Prepare for irrigation. Monitor temperatures closely."
-                    })
-        
-        # Rule 2: Flowering + Rain
-        if current_stage in ["flowering", "silking", "pollination"]:
-            rain_prob = max((f.get("rain_probability", 0) for f in forecast), default=0)
-            if rain_prob > 70:
-                risks.append({
-                    "type": "rain_during_flowering",
-                    "severity": "medium",
-                    "message": f"Rain expected ({rain_prob}% probability) during flowering may affect pollination",
-                    "action": "Monitor for disease after rain. Flowering timing may affect yield."
-                })
-        
-        # Rule 3: Maturity + Rain
-        if current_stage in ["maturity", "grain_filling", "boll_opening"]:
-            total_rain = sum(f.get("precipitation", 0) for f in forecast)
-            if total_rain > 20:
-                risks.append({
-                    "type": "rain_during_maturity",
-                    "severity": "high",
-                    "message": f"Heavy rain ({total_rain:.0f}mm) expected during {current_stage}. Risk of grain damage.",
-                    "action": "Consider early harvest if crop is ready. Inspect for fungal issues after rain."
-                })
-                alerts.append(f"🌧️ Rain Alert: {total_rain:.0f}mm expected - protect mature crop")
-        
-        # Rule 4: Seedling + Cold
-        if current_stage in ["germination", "seedling"]:
-            if any(f.get("temp_min", 10) < 10 for f in forecast):
-                risks.append({
-                    "type": "cold_stress_seedling",
-                    "severity": "medium",
-                    "message": "Cold temperatures may slow seedling growth",
-                    "action": "Provide mulch or protective covering if possible."
-                })
-        
-        # Rule 5: Vegetative drought (rainfed)
-        if current_stage == "vegetative" and irrigation_type == "rainfed":
-            if farming_impact.get("irrigation_needed", False) and not any(f.get("rain_probability", 0) > 50 for f in forecast):
-                risks.append({
-                    "type": "drought_stress",
-                    "severity": "medium",
-                    "message": "Drought conditions during vegetative growth may limit yield potential",
-                    "action": "Irrigate if possible. Consider foliar spray to reduce water stress."
-                })
+        if rules:
+            # Forecast aggregates used by the rules; WeatherAgent results
+            # carry them precomputed
+            stats = weather.get("forecast_stats") or forecast_stats(weather.get("forecast_3day", []))
+            
+            rule_context = {
+                "current_stage": current_stage,
+                "heat_sensitive": crop_stage.get("heat_sensitive", False),
+                "critical_temp": crop_stage.get("critical_temp_max"),
+                "temp": weather.get("current", {}).get("temperature", 25),
+                "farming_impact": weather.get("farming_impact", {}),
+                "irrigation_type": context.get("irrigation_type", "rainfed"),
+                "max_temp_max": stats["max_temp_max"],
+                "min_temp_min": stats["min_temp_min"],
+                "max_rain_prob": stats["max_rain_prob"],
+                "total_rain": stats["total_rain"]
+            }
+            for rule in rules:
+                rule(rule_context, risks, alerts)
         
         # Determine overall risk level
-        if any(r["severity"] == "high" for r in risks):
+        severities = {r["severity"] for r in risks}
+        if "high" in severities:
             overall_risk = "high"
-        elif any(r["severity"] == "medium" for r in risks):
+        elif "medium" in severities:
             overall_risk = "medium"
         else:
             overall_risk = "low"
         
-        return AgentResponse(
+        return AgentResponse.model_construct(
             result={
                 "overall_risk": overall_risk,
                 "risks": risks,
@@ -328,6 +418,26 @@ class RiskAssessmentAgent(BaseAgent):
 
 # ============== CONTEXT AGENT ==============
 
+class CropContext(TypedDict):
+    """Serialized crop entry in the farm context."""
+    crop_id: int
+    crop_type: str
+    variety: Optional[str]
+    sowing_date: Optional[str]
+    current_stage: str
+    is_active: bool
+
+
+_crop_fields = attrgetter("id", "crop_type", "variety", "sowing_date", "current_stage", "is_active")
+
+_FARMER_NOT_FOUND = AgentResponse.model_construct(
+    result={"error": "Farmer not found"},
+    confidence=0.0,
+    reasoning="No farmer context available",
+    data_sources=[]
+)
+
+
 class ContextAgent(BaseAgent):
     """
     Manages farm state and context.
@@ -342,17 +452,20 @@ class ContextAgent(BaseAgent):
         
         Context requires: farmer (FarmerDB), farm (FarmDB), crops (list[CropDB])
         """
+        return self.load(context)
+    
+    def load(self, context: dict) -> AgentResponse:
+        """
+        Synchronous body of execute().
+        Everything it needs is already in memory, so callers that do not
+        need an awaitable can skip scheduling it.
+        """
         farmer = context.get("farmer")
         farm = context.get("farm")
         crops = context.get("crops", [])
         
         if not farmer:
-            return AgentResponse(
-                result={"error": "Farmer not found"},
-                confidence=0.0,
-                reasoning="No farmer context available",
-                data_sources=[]
-            )
+            return _FARMER_NOT_FOUND
         
         # Build context
         farmer_context = {
@@ -374,22 +487,21 @@ class ContextAgent(BaseAgent):
                 "irrigation_type": farm.irrigation_type
             }
         
-        crops_context = []
-        primary_crop = None
-        for crop in crops:
-            crop_data = {
-                "crop_id": crop.id,
-                "crop_type": crop.crop_type,
-                "variety": crop.variety,
-                "sowing_date": crop.sowing_date.isoformat() if crop.sowing_date else None,
-                "current_stage": crop.current_stage,
-                "is_active": crop.is_active
-            }
-            crops_context.append(crop_data)
-            if crop.is_active and not primary_crop:
-                primary_crop = crop_data
-        
-        return AgentResponse(
+        crops_context: list[CropContext] = []
+        for crop_id, crop_type, variety, sowing_date, current_stage, is_active in map(_crop_fields, crops):
+            crops_context.append(CropContext(
+                crop_id=crop_id,
+                crop_type=crop_type,
+                variety=variety,
+                sowing_date=sowing_date.isoformat() if sowing_date else None,
+                current_stage=current_stage,
+                is_active=is_active
+            ))
+        
+        # Primary crop is the first active one
+        primary_crop = next((c for c in crops_context if c["is_active"]), None)
+        
+        return AgentResponse.model_construct(
             result={
                 "farmer": farmer_context,
                 "farm": farm_context,
@@ -406,6 +518,17 @@ class ContextAgent(BaseAgent):
 
 # ============== CONVERSATIONAL LLM AGENT ==============
 
+# Fallback intent keywords, checked in priority order
+_INTENT_PATTERNS = _compile_intent_patterns((
+    ("irrigation_query", ["water", "irrigat", "पानी", "నీరు", "ನೀರು"]),
+    ("weather_query", ["weather", "rain", "मौसम", "వర్షం", "ಮಳೆ", "forecast"]),
+    ("crop_status_query", ["status", "how is", "कैसी", "ఎలా", "ಹೇಗೆ", "stage", "condition"]),
+    ("harvest_query", ["harvest", "ready", "कटाई", "పంట కోత"]),
+    ("pest_disease_query", ["pest", "disease", "insect", "कीट", "పురుగు", "bug"]),
+    ("fertilizer_query", ["fertiliz", "खाद", "ఎరువు", "urea", "dap", "nutrient"]),
+    ("greeting", ["hello", "hi", "नमस्ते", "హలో", "help"]),
+))
+
 class ConversationalLLMAgent(BaseAgent):
     """
     Uses LLM for intent extraction and response generation.
@@ -420,7 +543,7 @@ class ConversationalLLMAgent(BaseAgent):
     name = "ConversationalLLMAgent"
     
     # Intent categories
-    INTENTS = [
+    INTENTS = (
         "irrigation_query",      # Should I water?
         "pest_disease_query",    # Pest/disease symptoms
         "fertilizer_query",      # Fertilizer timing
@@ -430,11 +553,10 @@ class ConversationalLLMAgent(BaseAgent):
         "general_farming",       # General advice
         "greeting",              # Hello, hi
         "unclear"                # Cannot determine
-    ]
+    )
     
     def __init__(self):
         """Initialize with LLM service."""
-        from .llm_service import get_llm_service
         self.llm_service = get_llm_service()
     
     async def execute(self, context: dict) -> AgentResponse:
@@ -454,9 +576,9 @@ class ConversationalLLMAgent(BaseAgent):
         if mode == "extract_intent" and query:
             return await self._extract_intent(query, language)
         elif mode == "generate_response" and decision_data:
-            return await self._generate_response(decision_data, context)
+            return await self.generate_response(decision_data, context)
         else:
-            return AgentResponse(
+            return AgentResponse.model_construct(
                 result={"error": "Invalid mode or missing data"},
                 confidence=0.0,
                 reasoning="Need query for intent extraction or decision_data for response",
@@ -469,6 +591,8 @@ class ConversationalLLMAgent(BaseAgent):
             # Use LLM service for intent extraction
             intent_result = await self.llm_service.extract_intent(query, language)
             
+            # Validated construction: confidence comes from the LLM and an
+            # out-of-range value should drop us into the keyword fallback.
             return AgentResponse(
                 result={
                     "intent": intent_result.intent,
@@ -485,8 +609,12 @@ class ConversationalLLMAgent(BaseAgent):
             print(f"LLM intent extraction failed, using fallback: {e}")
             return await self._fallback_intent(query)
     
-    async def _generate_response(self, decision_data: dict, context: dict) -> AgentResponse:
-        """Generate human-friendly response from decision data using LLM."""
+    async def generate_response(self, decision_data: dict, context: dict) -> AgentResponse:
+        """
+        Generate human-friendly response from decision data using LLM.
+        
+        Context requires: language; optional farmer_name
+        """
         farmer_name = context.get("farmer_name", "")
         language = context.get("language", "en")
         
@@ -498,7 +626,7 @@ class ConversationalLLMAgent(BaseAgent):
                 farmer_name=farmer_name
             )
             
-            return AgentResponse(
+            return AgentResponse.model_construct(
                 result={
                     "response": response_text,
                     "intent": decision_data.get("intent", "general_farming"),
@@ -513,39 +641,51 @@ class ConversationalLLMAgent(BaseAgent):
             # Fallback to template-based response
             return await self._fallback_response(decision_data, context)
     
+    async def stream_response(self, decision_data: dict, context: dict) -> AsyncIterator[str]:
+        """
+        Stream the human-friendly response as text chunks.
+        
+        Context requires: language; optional farmer_name
+        """
+        farmer_name = context.get("farmer_name", "")
+        language = context.get("language", "en")
+        streamed = False
+        
+        try:
+            async for chunk in self.llm_service.stream_response(
+                decision_data=decision_data,
+                language=language,
+                farmer_name=farmer_name
+            ):
+                streamed = True
+                yield chunk
+        except Exception as e:
+            print(f"LLM response streaming failed, using fallback: {e}")
+            if not streamed:
+                fallback = await self._fallback_response(decision_data, context)
+                yield fallback.result["response"]
+    
+    async def translate(self, text: str, language: str) -> str:
+        """Translate a finished reply; returns text unchanged on failure."""
+        return await self.llm_service.translate(text, language)
+    
     async def _fallback_intent(self, query: str) -> AgentResponse:
         """Fallback keyword-based intent extraction when LLM fails."""
         query_lower = query.lower()
         
         # Detect language from script
-        if any(c in query for c in "हिंदी मेरी फसल पानी खाद"):
-            lang = "hi"
-        elif any(c in query for c in "తెలుగు నా పంట నీరు"):
-            lang = "te"
-        elif any(c in query for c in "ಕನ್ನಡ ನನ್ನ ಬೆಳೆ ನೀರು"):
-            lang = "kn"
-        else:
-            lang = "en"
+        lang = next(
+            (code for code, script in _LANGUAGE_SCRIPTS if script.search(query)),
+            "en"
+        )
         
         # Keyword matching
-        if any(w in query_lower for w in ["water", "irrigat", "पानी", "నీరు", "ನೀರು"]):
-            intent = "irrigation_query"
-        elif any(w in query_lower for w in ["weather", "rain", "मौसम", "వర్షం", "ಮಳೆ", "forecast"]):
-            intent = "weather_query"
-        elif any(w in query_lower for w in ["status", "how is", "कैसी", "ఎలా", "ಹೇಗೆ", "stage", "condition"]):
-            intent = "crop_status_query"
-        elif any(w in query_lower for w in ["harvest", "ready", "कटाई", "పంట కోత"]):
-            intent = "harvest_query"
-        elif any(w in query_lower for w in ["pest", "disease", "insect", "कीट", "పురుగు", "bug"]):
-            intent = "pest_disease_query"
-        elif any(w in query_lower for w in ["fertiliz", "खाद", "ఎరువు", "urea", "dap", "nutrient"]):
-            intent = "fertilizer_query"
-        elif any(w in query_lower for w in ["hello", "hi", "नमस्ते", "హలో", "help"]):
-            intent = "greeting"
-        else:
-            intent = "general_farming"
+        intent = next(
+            (intent for intent, pattern in _INTENT_PATTERNS if pattern.search(query_lower)),
+            "general_farming"
+        )
         
-        return AgentResponse(
+        return AgentResponse.model_construct(
             result={
                 "intent": intent,
                 "entities": {},
@@ -598,7 +738,7 @@ class ConversationalLLMAgent(BaseAgent):
         
         final_response = "\n".join(response_parts)
         
-        return AgentResponse(
+        return AgentResponse.model_construct(
             result={
                 "response": final_response,
                 "intent": intent
@@ -611,6 +751,7 @@ class ConversationalLLMAgent(BaseAgent):
     def _format_irrigation_response(self, weather: dict, crop_stage: dict, recommendation: str) -> str:
         """Format irrigation-specific response."""
         impact = weather.get("farming_impact", {})
+        rain_risk = impact.get("rain_risk", 0)
         stage = crop_stage.get("current_stage", "")
         water_need = crop_stage.get("water_need", "medium")
         
@@ -619,10 +760,10 @@ class ConversationalLLMAgent(BaseAgent):
                 return f"**Yes, irrigate today.** Your crop is in {stage} stage which needs critical water. Current conditions are dry with no rain expected."
             else:
                 return f"**Yes, irrigation recommended.** Your crop is in {stage} stage. No significant rain is expected in the next few days."
-        elif impact.get("rain_risk", 0) > 0.5:
-            return f"**Hold irrigation.** There's a {impact.get('rain_risk')*100:.0f}% chance of rain. Wait and check tomorrow."
+        elif rain_risk > 0.5:
+            return f"**Hold irrigation.** There's a {rain_risk*100:.0f}% chance of rain. Wait and check tomorrow."
         else:
-            if water_need == "low" or water_need == "none":
+            if water_need in _LOW_WATER_NEEDS:
                 return f"**No irrigation needed.** Your crop is in {stage} stage with low water requirement."
             else:
                 return f"Irrigation is optional today. Your crop is in {stage} stage with {water_need} water needs. Monitor soil moisture."
@@ -633,27 +774,28 @@ class ConversationalLLMAgent(BaseAgent):
         forecast = weather.get("forecast_3day", [])
         impact = weather.get("farming_impact", {})
         
-        response = f"**Current Weather:** {current.get('temperature', '--')}°C, {current.get('condition', 'unknown')}"
+        parts = [f"**Current Weather:** {current.get('temperature', '--')}°C, {current.get('condition', 'unknown')}"]
         
         if forecast:
-            response += "\n\n**3-Day Forecast:**"
+            parts.append("\n\n**3-Day Forecast:**")
             for f in forecast[:3]:
-                response += f"\n• {f.get('date', '')}: {f.get('temp_min')}-{f.get('temp_max')}°C"
-                if f.get('rain_probability', 0) > 30:
-                    response += f" (Rain: {f.get('rain_probability')}%)"
+                rain_probability = f.get('rain_probability', 0)
+                parts.append(f"\n• {f.get('date', '')}: {f.get('temp_min')}-{f.get('temp_max')}°C")
+                if rain_probability > 30:
+                    parts.append(f" (Rain: {rain_probability}%)")
         
-        response += f"\n\n**For farming:** "
+        parts.append("\n\n**For farming:** ")
         if impact.get("spray_safe"):
-            response += "✅ Safe for spraying. "
+            parts.append("✅ Safe for spraying. ")
         else:
-            response += "❌ Not ideal for spraying. "
+            parts.append("❌ Not ideal for spraying. ")
         
         if impact.get("field_work_safe"):
-            response += "✅ Field work OK."
+            parts.append("✅ Field work OK.")
         else:
-            response += "⚠️ Avoid heavy field work."
+            parts.append("⚠️ Avoid heavy field work.")
         
-        return response
+        return "".join(parts)
     
     def _format_crop_status_response(self, crop_stage: dict) -> str:
         """Format crop status response."""
@@ -662,13 +804,17 @@ class ConversationalLLMAgent(BaseAgent):
         days = crop_stage.get("days_since_sowing", 0)
         water_need = crop_stage.get("water_need", "medium")
         nutrient_need = crop_stage.get("nutrient_need", "medium")
+        heat_sensitive = crop_stage.get("heat_sensitive")
+        
+        # Adjacent f-strings compile to a single string build
+        response = (
+            f"**Your crop is in {stage.replace('_', ' ')} stage** ({progress*100:.0f}% complete)\n"
+            f"• Days since sowing: {days}\n"
+            f"• Water requirement: {water_need}\n"
+            f"• Nutrient requirement: {nutrient_need}"
+        )
         
-        response = f"**Your crop is in {stage.replace('_', ' ')} stage** ({progress*100:.0f}% complete)\n"
-        response += f"• Days since sowing: {days}\n"
-        response += f"• Water requirement: {water_need}\n"
-        response += f"• Nutrient requirement: {nutrient_need}"
-        
-        if crop_stage.get("heat_sensitive"):
+        if heat_sensitive:
             response += f"\n\n⚠️ This stage is sensitive to heat. Critical temp: {crop_stage.get('critical_temp_max')}°C"
         
         return response
@@ -680,15 +826,175 @@ class ConversationalLLMAgent(BaseAgent):
         
         if stage == "harvest":
             return "**Your crop is ready for harvest!** Check weather for dry conditions before harvesting."
-        elif stage == "maturity":
-            return f"**Almost there!** Your crop is in maturity stage ({progress*100:.0f}% complete). Harvest in about 1-2 weeks depending on conditions."
+        
+        percent = progress * 100
+        if stage == "maturity":
+            return f"**Almost there!** Your crop is in maturity stage ({percent:.0f}% complete). Harvest in about 1-2 weeks depending on conditions."
         else:
             remaining = (1 - progress) * 100
-            return f"**Not yet ready for harvest.** Your crop is {progress*100:.0f}% through its lifecycle. Still {remaining:.0f}% to go in {stage} stage."
+            return f"**Not yet ready for harvest.** Your crop is {percent:.0f}% through its lifecycle. Still {remaining:.0f}% to go in {stage} stage."
+
+
+# Singleton instance
+_conversational_agent: Optional[ConversationalLLMAgent] = None
+
+
+def get_conversational_agent() -> ConversationalLLMAgent:
+    """Get or create the conversational agent singleton."""
+    global _conversational_agent
+    if _conversational_agent is None:
+        _conversational_agent = ConversationalLLMAgent()
+    return _conversational_agent
 
 
 # ============== DECISION ORCHESTRATOR ==============
 
+# Always have the LLM compose replies, even for self-contained decisions
+FORCE_LLM = os.getenv("FORCE_LLM", "0") == "1"
+
+# Water needs that call for irrigation when the field is dry
+_HIGH_WATER_NEEDS = frozenset({"high", "critical"})
+_LOW_WATER_NEEDS = frozenset({"low", "none"})
+
+
+def _decide_irrigation(
+    rain_risk: float, irrigation_needed: bool, spray_safe: bool,
+    stage: str, water_need: str, risk_level: str
+) -> str:
+    """Irrigation decision rules."""
+    if rain_risk > 0.6:
+        return "Do not irrigate today - rain is expected."
+    elif irrigation_needed and water_need in _HIGH_WATER_NEEDS:
+        return "Irrigation recommended today."
+    elif water_need in _LOW_WATER_NEEDS:
+        return f"Irrigation not necessary - {stage} stage has low water needs."
+    else:
+        return "Optional irrigation - monitor soil moisture."
+
+
+def _decide_harvest(
+    rain_risk: float, irrigation_needed: bool, spray_safe: bool,
+    stage: str, water_need: str, risk_level: str
+) -> str:
+    """Harvest readiness rules."""
+    if stage == "harvest":
+        if rain_risk < 0.3:
+            return "Your crop is ready for harvest. Weather looks good."
+        else:
+            return "Crop ready but rain expected. Harvest quickly or wait for dry spell."
+    elif stage == "maturity":
+        return "Crop nearly ready. Prepare for harvest in 1-2 weeks."
+    else:
+        return f"Crop not ready - currently in {stage} stage."
+
+
+def _decide_weather(
+    rain_risk: float, irrigation_needed: bool, spray_safe: bool,
+    stage: str, water_need: str, risk_level: str
+) -> str:
+    """Field work / spraying conditions."""
+    if spray_safe:
+        return "Good conditions for field work and spraying."
+    else:
+        return "Weather may affect field activities. Check before spraying."
+
+
+def _decide_pest_disease(
+    rain_risk: float, irrigation_needed: bool, spray_safe: bool,
+    stage: str, water_need: str, risk_level: str
+) -> str:
+    """Pest and disease queries need symptoms from the farmer."""
+    return "For pest/disease issues, describe symptoms or upload a photo. Common issues for this stage are being assessed."
+
+
+def _decide_default(
+    rain_risk: float, irrigation_needed: bool, spray_safe: bool,
+    stage: str, water_need: str, risk_level: str
+) -> str:
+    """Any other intent: report overall crop risk."""
+    if risk_level == "high":
+        return f"Alert: High risk detected for your {stage} stage crop. Take precautions."
+    else:
+        return "Your crop is progressing well. Keep monitoring."
+
+
+# Intent -> decision rule; intents not listed use _decide_default
+_DECISION_HANDLERS = {
+    "irrigation_query": _decide_irrigation,
+    "harvest_query": _decide_harvest,
+    "weather_query": _decide_weather,
+    "pest_disease_query": _decide_pest_disease,
+}
+
+
+@lru_cache(maxsize=256)
+def _decide(
+    intent: str, rain_risk: float, irrigation_needed: bool, spray_safe: bool,
+    stage: str, water_need: str, risk_level: str
+) -> str:
+    """
+    Memoized decision. Every input is a scalar, and the rules are pure,
+    so identical situations share one result.
+    """
+    handler = _DECISION_HANDLERS.get(intent, _decide_default)
+    return handler(rain_risk, irrigation_needed, spray_safe, stage, water_need, risk_level)
+
+
+# Queries made up only of these words are answered without running any agent
+_GREETING_WORDS = frozenset({
+    "hello", "hi", "hey", "namaste", "namaskar",
+    "नमस्ते", "नमस्कार", "హలో", "నమస్తే", "నమస్కారం", "ನಮಸ್ಕಾರ", "ಹಲೋ",
+})
+_GREETING_STRIP = ".,!?।"
+
+# Canned (salutation, question) per farmer language
+_GREETINGS = {
+    "en": ("Hello", "How can I help you with your farming today?"),
+    "hi": ("नमस्ते", "आज मैं आपकी खेती में कैसे मदद कर सकता हूँ?"),
+    "te": ("నమస్తే", "ఈ రోజు మీ వ్యవసాయంలో నేను ఎలా సహాయం చేయగలను?"),
+    "kn": ("ನಮಸ್ಕಾರ", "ಇಂದು ನಿಮ್ಮ ಕೃಷಿಯಲ್ಲಿ ನಾನು ಹೇಗೆ ಸಹಾಯ ಮಾಡಲಿ?"),
+}
+
+# ChatResponse fields other than response for a greeting; shared, read-only.
+# Use _greeting_summary() to get a copy with a list of data_sources.
+_GREETING_SUMMARY = MappingProxyType({
+    "confidence": 1.0,
+    "reasoning": "Intent: greeting | Answered without running agents",
+    "data_sources": ("greeting",),
+    "alerts": None
+})
+
+
+def _greeting_summary() -> dict:
+    """_GREETING_SUMMARY with its own data_sources list for one response."""
+    return {**_GREETING_SUMMARY, "data_sources": list(_GREETING_SUMMARY["data_sources"])}
+
+
+@lru_cache(maxsize=1024)
+def _is_bare_greeting(query: str) -> bool:
+    """
+    True when the query is nothing but greeting words. Memoized, since
+    prefetch() and process_query() both ask about the same query.
+    """
+    # Most queries fail on their first word, so stop there
+    has_greeting = False
+    for word in query.lower().split():
+        word = word.strip(_GREETING_STRIP)
+        if not word:
+            continue
+        if word not in _GREETING_WORDS:
+            return False
+        has_greeting = True
+    return has_greeting
+
+# The deterministic agents keep no per-request state (caches are module
+# level), so all orchestrators share one instance of each
+_weather_agent = WeatherAgent()
+_crop_stage_agent = CropStageAgent()
+_risk_agent = RiskAssessmentAgent()
+_context_agent = ContextAgent()
+
+
 class DecisionOrchestrator:
     """
     Central coordinator for all agents.
@@ -700,12 +1006,59 @@ class DecisionOrchestrator:
     - Agents never talk to each other directly
     """
     
+    # Agent dependency graph: node -> nodes whose results it consumes.
+    # Listed in topological order; nodes without a path between them run
+    # concurrently. Farm context is built before the graph starts, since
+    # it only reads objects already in memory.
+    AGENT_DAG = {
+        "intent": (),
+        "weather": (),
+        "crop_stage": ("intent", "weather"),
+        "risk": ("weather", "crop_stage"),
+    }
+    
+    # Intents whose decision does not use crop stage or risk data;
+    # those agents are skipped for them.
+    FASTPATH_INTENTS = frozenset({"pest_disease_query", "weather_query", "greeting", "unclear"})
+    
+    # Nodes the decision can do without; if one raises, it is logged and
+    # treated as not applicable instead of failing the whole query
+    OPTIONAL_NODES = frozenset({"weather", "crop_stage", "risk"})
+    
+    # Intents whose rule-based recommendation already answers the farmer;
+    # the LLM only translates it (set FORCE_LLM=1 to always generate)
+    SELF_CONTAINED_INTENTS = frozenset({"irrigation_query", "harvest_query", "pest_disease_query"})
+    
+    # Nodes still running once intent is known that the intent makes
+    # unnecessary; the query stops waiting on them and treats them as not
+    # applicable. This saves latency only, not Open-Meteo calls: the chat
+    # handlers prefetch weather for every query that is not a bare greeting,
+    # before the intent is known, and that shared fetch still completes and
+    # fills the cache.
+    CANCEL_ON_INTENT = {
+        "pest_disease_query": ("weather",),
+        "greeting": ("weather",),
+        "unclear": ("weather",),
+    }
+    
     def __init__(self):
-        self.weather_agent = WeatherAgent()
-        self.crop_stage_agent = CropStageAgent()
-        self.risk_agent = RiskAssessmentAgent()
-        self.context_agent = ContextAgent()
-        self.llm_agent = ConversationalLLMAgent()
+        self.weather_agent = _weather_agent
+        self.crop_stage_agent = _crop_stage_agent
+        self.risk_agent = _risk_agent
+        self.context_agent = _context_agent
+        self.llm_agent = get_conversational_agent()
+    
+    def prefetch(self, farmer: FarmerDB, query: str):
+        """
+        Start the farmer's weather fetch ahead of process_query/stream_query,
+        so it overlaps whatever the caller still has to load or save. The
+        weather node of the graph then joins it instead of starting its own.
+        Bare greetings never reach the graph, so they fetch nothing; any
+        other query fetches, even if its intent later turns out not to use
+        weather (see CANCEL_ON_INTENT).
+        """
+        if not _is_bare_greeting(query):
+            self.weather_agent.prefetch(farmer.latitude, farmer.longitude)
     
     async def process_query(
         self,
@@ -719,77 +1072,150 @@ class DecisionOrchestrator:
         Process a farmer query through the multi-agent system.
         
         Flow:
-        1. LLM extracts intent
-        2. Context Agent loads farm state
-        3. Orchestrator selects relevant agents
-        4. Agents execute and return data
-        5. Orchestrator makes deterministic decision
-        6. LLM explains result to farmer
+        1. Farm context is loaded, then agents in AGENT_DAG run as soon as
+           their inputs are ready (intent and weather concurrently, then
+           crop stage, then risk)
+        2. Orchestrator makes deterministic decision
+        3. LLM explains result to farmer (or, for SELF_CONTAINED_INTENTS,
+           only translates the recommendation)
+        
+        Bare greetings skip all of the above.
+        """
+        greeting = self._greeting(farmer, query)
+        if greeting:
+            return ChatResponse.model_construct(response=greeting, **_greeting_summary())
+        
+        decision_data, summary = await self._analyze(farmer, farm, crops, query)
+        
+        reply = await self._self_contained_reply(farmer, decision_data)
+        if reply:
+            return ChatResponse.model_construct(response=reply, **summary)
+        
+        # Step 3: Generate human-friendly response in farmer's language
+        llm_response = await self.llm_agent.generate_response(decision_data, {
+            "farmer_name": farmer.name,
+            "language": farmer.language if farmer.language else "en"
+        })
+        final_response = llm_response.result.get("response")
+        
+        # If LLM failed, use the deterministic recommendation as fallback
+        if not final_response:
+            final_response = self._recommendation_text(farmer, decision_data["recommendation"])
+        
+        return ChatResponse.model_construct(response=final_response, **summary)
+    
+    async def stream_query(
+        self,
+        farmer: FarmerDB,
+        farm: Optional[FarmDB],
+        crops: list[CropDB],
+        query: str,
+        db: Any
+    ) -> AsyncIterator[dict]:
+        """
+        Streaming variant of process_query.
+        
+        Yields a "meta" event carrying confidence, reasoning, data_sources
+        and alerts and a "recommendation" event with the rule-based decision
+        as soon as it is made, then "token" events with the response text
+        as the LLM generates it.
+        """
+        greeting = self._greeting(farmer, query)
+        if greeting:
+            yield {"type": "meta", **_greeting_summary()}
+            yield {"type": "token", "content": greeting}
+            return
+        
+        decision_data, summary = await self._analyze(farmer, farm, crops, query)
+        yield {"type": "meta", **summary}
+        # Deterministic answer is ready now; the LLM wording follows
+        yield {"type": "recommendation", "content": decision_data["recommendation"]}
+        
+        reply = await self._self_contained_reply(farmer, decision_data)
+        if reply:
+            yield {"type": "token", "content": reply}
+            return
+        
+        streamed = False
+        async for chunk in self.llm_agent.stream_response(decision_data, {
+            "farmer_name": farmer.name,
+            "language": farmer.language if farmer.language else "en"
+        }):
+            streamed = True
+            yield {"type": "token", "content": chunk}
+        
+        # If LLM failed, use the deterministic recommendation as fallback
+        if not streamed:
+            yield {
+                "type": "token",
+                "content": self._recommendation_text(farmer, decision_data["recommendation"])
+            }
+    
+    async def _analyze(
+        self,
+        farmer: FarmerDB,
+        farm: Optional[FarmDB],
+        crops: list[CropDB],
+        query: str
+    ) -> tuple[dict, dict]:
+        """
+        Run the agents and make the deterministic decision.
+        
+        Returns:
+            (decision_data for the LLM, ChatResponse fields other than response)
         """
         
         # Get farmer's preferred language
         farmer_language = farmer.language if farmer.language else "en"
         
-        # Step 1: Extract intent (using LLM)
-        intent_response = await self.llm_agent.execute({
+        # Step 1: Load farm context, then run the agent graph
+        context_response = self.context_agent.load({
+            "farmer": farmer,
+            "farm": farm,
+            "crops": crops
+        })
+        responses = await self._run_dag({
+            "context": context_response,
             "query": query,
-            "mode": "extract_intent",
-            "language": farmer_language
+            "language": farmer_language,
+            # Scalars the nodes need, read off the ORM objects once
+            "latitude": farmer.latitude,
+            "longitude": farmer.longitude,
+            "irrigation_type": farm.irrigation_type if farm else "rainfed",
+            # Clock read once per query
+            "today": date.today()
         })
+        intent_response = responses["intent"]
+        weather_response = responses["weather"]
+        crop_stage_response = responses["crop_stage"]
+        risk_response = responses["risk"]
+        
         intent_data = intent_response.result
         intent = intent_data.get("intent", "general_farming")
         detected_language = intent_data.get("language_detected", farmer_language)
-        
-        # Step 2: Load context
-        context_response = await self.context_agent.execute({
-            "farmer": farmer,
-            "farm": farm,
-            "crops": crops
-        })
         context_data = context_response.result
         
-        # Get primary crop
-        primary_crop = context_data.get("primary_crop")
-        
-        # Collect all data sources
-        all_sources = ["intent_extraction"]
+        # Collect all data sources (dict keys: deduplicated, in order)
+        all_sources = dict.fromkeys(["intent_extraction"])
         all_alerts = []
         
-        # Step 3: Call relevant agents based on intent
-        weather_data = {}
+        weather_data = self._weather_data(responses)
         crop_stage_data = {}
         risk_data = {}
         
-        # Weather is almost always needed
-        if context_data.get("has_location"):
-            weather_response = await self.weather_agent.execute({
-                "latitude": farmer.latitude,
-                "longitude": farmer.longitude
-            })
-            weather_data = weather_response.result
-            all_sources.extend(weather_response.data_sources)
-        
-        # Crop stage if we have a crop
-        if primary_crop:
-            crop_stage_response = await self.crop_stage_agent.execute({
-                "crop_type": primary_crop.get("crop_type"),
-                "sowing_date": primary_crop.get("sowing_date"),
-                "weather_data": weather_data
-            })
+        if weather_data:
+            all_sources.update(dict.fromkeys(weather_response.data_sources))
+        
+        if crop_stage_response:
             crop_stage_data = crop_stage_response.result
-            all_sources.extend(crop_stage_response.data_sources)
-            
-            # Risk assessment
-            risk_response = await self.risk_agent.execute({
-                "crop_stage_data": crop_stage_data,
-                "weather_data": weather_data,
-                "irrigation_type": farm.irrigation_type if farm else "rainfed"
-            })
+            all_sources.update(dict.fromkeys(crop_stage_response.data_sources))
+        
+        if risk_response:
             risk_data = risk_response.result
-            all_sources.extend(risk_response.data_sources)
+            all_sources.update(dict.fromkeys(risk_response.data_sources))
             all_alerts.extend(risk_data.get("alerts", []))
         
-        # Step 4: Make deterministic decision
+        # Step 2: Make deterministic decision
         recommendation = self._make_decision(
             intent=intent,
             weather=weather_data,
@@ -798,50 +1224,177 @@ class DecisionOrchestrator:
             context=context_data
         )
         
-        # Step 5: Generate human-friendly response in farmer's language
-        response_context = {
-            "decision_data": {
-                "intent": intent,
-                "weather": weather_data,
-                "crop_stage": crop_stage_data,
-                "risks": risk_data,
-                "recommendation": recommendation,
-                "alerts": all_alerts
-            },
-            "farmer_name": farmer.name,
-            "language": farmer_language,  # Response in farmer's language
-            "mode": "generate_response"
+        decision_data = {
+            "intent": intent,
+            "weather": weather_data,
+            "crop_stage": crop_stage_data,
+            "risks": risk_data,
+            "recommendation": recommendation,
+            "alerts": all_alerts
         }
         
-        llm_response = await self.llm_agent.execute(response_context)
-        final_response = llm_response.result.get("response")
-        
-        # If LLM failed, use the deterministic recommendation as fallback
-        if not final_response:
-            if farmer.name:
-                final_response = f"Hello {farmer.name}! {recommendation}"
-            else:
-                final_response = recommendation
-        
         # Calculate overall confidence
-        confidences = [
-            intent_response.confidence,
-            context_response.confidence
-        ]
+        confidence_total = intent_response.confidence + context_response.confidence
+        confidence_count = 2
         if weather_data and "error" not in weather_data:
-            confidences.append(0.9)
+            confidence_total += 0.9
+            confidence_count += 1
         if crop_stage_data and "error" not in crop_stage_data:
-            confidences.append(0.85)
+            confidence_total += 0.85
+            confidence_count += 1
         
-        avg_confidence = sum(confidences) / len(confidences)
+        avg_confidence = confidence_total / confidence_count
         
-        return ChatResponse(
-            response=final_response,
-            confidence=avg_confidence,
-            reasoning=f"Intent: {intent} | Stage: {crop_stage_data.get('current_stage', 'N/A')} | Risk: {risk_data.get('overall_risk', 'N/A')}",
-            data_sources=list(set(all_sources)),
-            alerts=all_alerts if all_alerts else None
-        )
+        summary = {
+            "confidence": avg_confidence,
+            "reasoning": f"Intent: {intent} | Stage: {crop_stage_data.get('current_stage', 'N/A')} | Risk: {risk_data.get('overall_risk', 'N/A')}",
+            "data_sources": list(all_sources),
+            "alerts": all_alerts or None
+        }
+        
+        return decision_data, summary
+    
+    async def _self_contained_reply(self, farmer: FarmerDB, decision_data: dict) -> Optional[str]:
+        """
+        Reply made from the recommendation alone, or None when the LLM
+        should compose the answer. Non-English farmers get a translation,
+        which is a much shorter LLM task than open-ended generation.
+        """
+        if FORCE_LLM or decision_data["intent"] not in self.SELF_CONTAINED_INTENTS:
+            return None
+        
+        text = self._recommendation_text(farmer, decision_data["recommendation"])
+        language = farmer.language or "en"
+        if language != "en":
+            text = await self.llm_agent.translate(text, language)
+        return text
+    
+    def _greeting(self, farmer: FarmerDB, query: str) -> Optional[str]:
+        """
+        Canned reply when the query is nothing but a greeting, else None.
+        Answering these deterministically avoids the weather fetch and
+        both LLM calls.
+        """
+        if not _is_bare_greeting(query):
+            return None
+        
+        salutation, question = _GREETINGS.get(farmer.language or "en", _GREETINGS["en"])
+        if farmer.name:
+            return f"{salutation} {farmer.name}! {question}"
+        return f"{salutation}! {question}"
+    
+    def _recommendation_text(self, farmer: FarmerDB, recommendation: str) -> str:
+        """Deterministic recommendation addressed to the farmer."""
+        if farmer.name:
+            return f"Hello {farmer.name}! {recommendation}"
+        return recommendation
+    
+    async def _run_dag(self, inputs: dict) -> dict[str, Optional[AgentResponse]]:
+        """
+        Execute every node of AGENT_DAG once its dependencies have finished.
+        
+        Each node runs in its own task and awaits only the nodes it depends
+        on, so total latency follows the critical path rather than the sum
+        of all agents. A node returns None when it does not apply,
+        including when CANCEL_ON_INTENT cancels it part way or when an
+        OPTIONAL_NODES node raises.
+        """
+        tasks: dict[str, asyncio.Task] = {}
+        skipped: set[str] = set()
+        
+        async def run_node(node: str) -> Optional[AgentResponse]:
+            try:
+                deps = self.AGENT_DAG[node]
+                dep_results = await asyncio.gather(*(tasks[d] for d in deps))
+                results = dict(zip(deps, dep_results))
+                return await getattr(self, f"_node_{node}")(inputs, results)
+            except asyncio.CancelledError:
+                if node in skipped:
+                    return None
+                raise
+            except Exception as e:
+                if node not in self.OPTIONAL_NODES:
+                    raise
+                print(f"{node} agent failed, continuing without it: {e}")
+                return None
+        
+        def skip_unneeded(intent_task: asyncio.Task):
+            if intent_task.cancelled() or intent_task.exception():
+                return
+            intent = intent_task.result().result.get("intent")
+            for node in self.CANCEL_ON_INTENT.get(intent, ()):
+                if not tasks[node].done():
+                    skipped.add(node)
+                    tasks[node].cancel()
+        
+        # All tasks exist before any of them runs, so lookups in run_node are safe
+        for node in self.AGENT_DAG:
+            tasks[node] = asyncio.create_task(run_node(node))
+        tasks["intent"].add_done_callback(skip_unneeded)
+        
+        try:
+            results = await asyncio.gather(*tasks.values())
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+            raise
+        
+        return dict(zip(tasks, results))
+    
+    def _weather_data(self, results: dict) -> dict:
+        """Weather result, or empty dict when the farmer has no location."""
+        weather_response = results["weather"]
+        return weather_response.result if weather_response else {}
+    
+    async def _node_intent(self, inputs: dict, results: dict) -> AgentResponse:
+        """Extract intent (using LLM)."""
+        return await self.llm_agent.execute({
+            "query": inputs["query"],
+            "mode": "extract_intent",
+            "language": inputs["language"]
+        })
+    
+    async def _node_weather(self, inputs: dict, results: dict) -> Optional[AgentResponse]:
+        """
+        Fetch weather for the farmer's location.
+        Gated on the farmer's coordinates directly, so it never waits on context.
+        """
+        lat, lon = inputs["latitude"], inputs["longitude"]
+        if not (lat and lon):
+            return None
+        
+        return await self.weather_agent.execute({
+            "latitude": lat,
+            "longitude": lon
+        })
+    
+    async def _node_crop_stage(self, inputs: dict, results: dict) -> Optional[AgentResponse]:
+        """Calculate crop stage if we have a crop and the intent uses it."""
+        if results["intent"].result.get("intent") in self.FASTPATH_INTENTS:
+            return None
+        
+        primary_crop = inputs["context"].result.get("primary_crop")
+        if not primary_crop:
+            return None
+        
+        return await self.crop_stage_agent.execute({
+            "crop_type": primary_crop.get("crop_type"),
+            "sowing_date": primary_crop.get("sowing_date"),
+            "weather_data": self._weather_data(results),
+            "today": inputs["today"]
+        })
+    
+    async def _node_risk(self, inputs: dict, results: dict) -> Optional[AgentResponse]:
+        """Assess risks for the crop stage."""
+        crop_stage_response = results["crop_stage"]
+        if not crop_stage_response:
+            return None
+        
+        return await self.risk_agent.execute({
+            "crop_stage_data": crop_stage_response.result,
+            "weather_data": self._weather_data(results),
+            "irrigation_type": inputs["irrigation_type"]
+        })
     
     def _make_decision(
         self,
@@ -856,43 +1409,24 @@ class DecisionOrchestrator:
         NO LLM LOGIC HERE - purely rule-based.
         """
         impact = weather.get("farming_impact", {})
-        stage = crop_stage.get("current_stage", "")
-        water_need = crop_stage.get("water_need", "medium")
-        risk_level = risks.get("overall_risk", "low")
-        
-        if intent == "irrigation_query":
-            # Irrigation decision rules
-            if impact.get("rain_risk", 0) > 0.6:
-                return "Do not irrigate today - rain is expected."
-            elif impact.get("irrigation_needed") and water_need in ["high", "critical"]:
-                return "Irrigation recommended today."
-            elif water_need == "low" or water_need == "none":
-                return f"Irrigation not necessary - {stage} stage has low water needs."
-            else:
-                return "Optional irrigation - monitor soil moisture."
-        
-        elif intent == "harvest_query":
-            if stage == "harvest":
-                if impact.get("rain_risk", 0) < 0.3:
-                    return "Your crop is ready for harvest. Weather looks good."
-                else:
-                    return "Crop ready but rain expected. Harvest quickly or wait for dry spell."
-            elif stage == "maturity":
-                return "Crop nearly ready. Prepare for harvest in 1-2 weeks."
-            else:
-                return f"Crop not ready - currently in {stage} stage."
-        
-        elif intent == "weather_query":
-            if impact.get("spray_safe"):
-                return "Good conditions for field work and spraying."
-            else:
-                return "Weather may affect field activities. Check before spraying."
-        
-        elif intent == "pest_disease_query":
-            return "For pest/disease issues, describe symptoms or upload a photo. Common issues for this stage are being assessed."
-        
-        else:
-            if risk_level == "high":
-                return f"Alert: High risk detected for your {stage} stage crop. Take precautions."
-            else:
-                return "Your crop is progressing well. Keep monitoring."
+        return _decide(
+            intent,
+            impact.get("rain_risk", 0),
+            impact.get("irrigation_needed"),
+            impact.get("spray_safe"),
+            crop_stage.get("current_stage", ""),
+            crop_stage.get("water_need", "medium"),
+            risks.get("overall_risk", "low")
+        )
+
+
+# Singleton instance
+_orchestrator: Optional[DecisionOrchestrator] = None
+
+
+def get_orchestrator() -> DecisionOrchestrator:
+    """Get or create the orchestrator singleton used by the routers."""
+    global _orchestrator
+    if _orchestrator is None:
+        _orchestrator = DecisionOrchestrator()
+    return _orchestrator
@@ -3,24 +3,26 @@ Authentication module for Agricultural Decision Support System.
 Simple JWT-based auth with OTP verification (mockable for development).
 """
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional
+import hashlib
+import hmac
 import os
 import secrets
+import time
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from jose import JWTError, jwt
-from passlib.context import CryptContext
 from pydantic import BaseModel
 
+from .utils.cache import TTLCache
+
 # Configuration
 SECRET_KEY = os.getenv("SECRET_KEY", "dev-secret-key-change-in-production-" + secrets.token_hex(16))
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24 * 7  # 7 days
 
-# Password hashing (for future use if needed)
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
 # Security scheme
 security = HTTPBearer()
 
@@ -52,10 +54,26 @@ class TokenData(BaseModel):
     farmer_id: Optional[int] = None
 
 
+# ============== PASSWORD HASHING ==============
+
+@lru_cache(maxsize=1)
+def get_pwd_context():
+    """
+    Password hashing context (for future use if needed).
+    Built on first use so passlib and the bcrypt backend are not loaded
+    at startup.
+    """
+    from passlib.context import CryptContext
+    return CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+
 # ============== OTP STORAGE (In-memory for dev) ==============
 
-# In production, use Redis or database
-_otp_store: dict[str, tuple[str, datetime]] = {}
+# In production, use Redis or database.
+# Phone -> OTP; each OTP lives OTP_TTL seconds.
+OTP_TTL = 300  # seconds
+OTP_STORE_SIZE = 100_000
+_otp_store: TTLCache[str] = TTLCache(OTP_TTL, OTP_STORE_SIZE)
 
 
 def generate_otp(phone: str) -> str:
@@ -64,10 +82,10 @@ def generate_otp(phone: str) -> str:
     if os.getenv("ENVIRONMENT", "development") == "development":
         otp = "123456"
     else:
-        otp = "".join([str(secrets.randbelow(10)) for _ in range(6)])
+        otp = f"{secrets.randbelow(1_000_000):06d}"
     
     # Store with expiry (5 minutes)
-    _otp_store[phone] = (otp, datetime.utcnow() + timedelta(minutes=5))
+    _otp_store.set(phone, otp)
     return otp
 
 
@@ -77,17 +95,12 @@ def verify_otp(phone: str, otp: str) -> bool:
     if os.getenv("ENVIRONMENT", "development") == "development" and otp == "123456":
         return True
     
-    stored = _otp_store.get(phone)
-    if not stored:
+    stored_otp = _otp_store.get(phone)
+    if stored_otp is None:
         return False
     
-    stored_otp, expiry = stored
-    if datetime.utcnow() > expiry:
-        del _otp_store[phone]
-        return False
-    
-    if stored_otp == otp:
-        del _otp_store[phone]
+    if hmac.compare_digest(stored_otp.encode(), otp.encode()):
+        _otp_store.pop(phone)
         return True
     
     return False
@@ -95,6 +108,14 @@ def verify_otp(phone: str, otp: str) -> bool:
 
 # ============== JWT FUNCTIONS ==============
 
+# Recently decoded tokens keyed by blake2b of the token (raw tokens are not
+# kept). An entry lives TOKEN_CACHE_TTL seconds, never past the token's own
+# exp. Failures are not cached, so invalid tokens always go through jwt.decode.
+TOKEN_CACHE_TTL = 300  # seconds
+TOKEN_CACHE_SIZE = 10000
+_token_cache: TTLCache[TokenData] = TTLCache(TOKEN_CACHE_TTL, TOKEN_CACHE_SIZE)
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create JWT access token."""
     to_encode = data.copy()
@@ -104,7 +125,16 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
 
 
 def decode_token(token: str) -> TokenData:
-    """Decode and validate JWT token."""
+    """
+    Decode and validate JWT token.
+    A token seen in the last TOKEN_CACHE_TTL seconds skips the signature
+    check and JSON parse; treat the returned TokenData as read-only.
+    """
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    cached = _token_cache.get(key)
+    if cached is not None:
+        return cached
+    
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         phone = payload.get("sub")
@@ -114,12 +144,19 @@ def decode_token(token: str) -> TokenData:
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid token",
             )
-        return TokenData(phone=phone, farmer_id=farmer_id)
+        token_data = TokenData(phone=phone, farmer_id=farmer_id)
     except JWTError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid token",
         )
+    
+    ttl = TOKEN_CACHE_TTL
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        ttl = min(ttl, exp - time.time())
+    _token_cache.set(key, token_data, ttl)
+    return token_data
 
 
 # ============== DEPENDENCIES ==============
@@ -2,6 +2,7 @@
 Database configuration for Agricultural Decision Support System.
 Uses SQLite with async SQLAlchemy for simplicity.
 """
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
 import os
@@ -9,13 +10,39 @@ import os
 # Database URL - SQLite for development, can switch to PostgreSQL
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite+aiosqlite:///./data/farm_advisor.db")
 
-# Create async engine
+IS_SQLITE = DATABASE_URL.startswith("sqlite")
+
+# Per-connection SQLite settings: WAL lets readers run during a write, and
+# NORMAL sync is durable under WAL except on power loss
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",  # 64 MB
+)
+
+# Create async engine. SQLite keeps SQLAlchemy's default pool; server
+# databases get a larger pool with a liveness check on checkout.
 engine = create_async_engine(
     DATABASE_URL,
     echo=False,
-    future=True
+    future=True,
+    **({} if IS_SQLITE else {
+        "pool_size": 20,
+        "max_overflow": 40,
+        "pool_pre_ping": True
+    })
 )
 
+if IS_SQLITE:
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        """Apply SQLITE_PRAGMAS to each new connection."""
+        cursor = dbapi_connection.cursor()
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+        cursor.close()
+
 # Session factory
 async_session_maker = async_sessionmaker(
     engine,
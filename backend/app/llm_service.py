@@ -12,11 +12,17 @@ IMPORTANT: The LLM does NOT make farming decisions.
 It only understands queries and explains decisions made by rule-based agents.
 """
 import os
-import json
+import re
+import asyncio
+import hashlib
 import httpx
-from typing import Optional
+import orjson
+from typing import Optional, AsyncIterator
 from pydantic import BaseModel
 
+from .utils.cache import TTLCache
+from .utils.http import get_http_client
+
 
 class IntentResult(BaseModel):
     """Result of intent extraction."""
@@ -26,6 +32,40 @@ class IntentResult(BaseModel):
     language_detected: str
 
 
+# Fallback language detection by Unicode block of the script, in priority
+# order. Also used by ConversationalLLMAgent in agents.py.
+_LANGUAGE_SCRIPTS = (
+    ("hi", re.compile("[\u0900-\u097f]")),  # Devanagari
+    ("te", re.compile("[\u0c00-\u0c7f]")),  # Telugu
+    ("kn", re.compile("[\u0c80-\u0cff]")),  # Kannada
+)
+
+
+def _compile_intent_patterns(
+    keywords_by_intent: tuple[tuple[str, list[str]], ...]
+) -> tuple[tuple[str, re.Pattern], ...]:
+    """
+    Compile (intent, keywords) pairs for keyword fallback, keeping their
+    priority order. Each keyword list becomes a single alternation pattern.
+    """
+    return tuple(
+        (intent, re.compile("|".join(map(re.escape, keywords))))
+        for intent, keywords in keywords_by_intent
+    )
+
+
+# Fallback intent keywords, checked in priority order
+_INTENT_PATTERNS = _compile_intent_patterns((
+    ("irrigation_query", ["water", "irrigat", "पानी", "నీరు", "ನೀರು"]),
+    ("weather_query", ["weather", "rain", "मौसम", "వర్షం", "ಮಳೆ"]),
+    ("crop_status_query", ["status", "how is", "कैसी", "ఎలా", "ಹೇಗೆ", "stage"]),
+    ("harvest_query", ["harvest", "ready", "कटाई", "పంట కోత"]),
+    ("pest_disease_query", ["pest", "disease", "insect", "कीट", "పురుగు"]),
+    ("fertilizer_query", ["fertiliz", "खाद", "ఎరువు", "urea", "dap"]),
+    ("greeting", ["hello", "hi", "नमस्ते", "హలో"]),
+))
+
+
 class LLMService:
     """
     LLM service for natural language understanding and generation.
@@ -33,7 +73,7 @@ class LLMService:
     """
     
     # Supported intents
-    INTENTS = [
+    INTENTS = (
         "irrigation_query",      # Should I water? When to irrigate?
         "weather_query",         # Weather forecast, rain prediction
         "crop_status_query",     # How is my crop? Current stage?
@@ -44,7 +84,7 @@ class LLMService:
         "general_farming",       # General advice
         "greeting",              # Hello, hi, namaste
         "unclear"                # Cannot determine
-    ]
+    )
     
     # Language codes and names
     LANGUAGES = {
@@ -56,18 +96,28 @@ class LLMService:
         "mr": "Marathi"
     }
     
-    def __init__(self, provider: str = "ollama"):
+    # Generated responses are reused for identical decision data
+    RESPONSE_CACHE_TTL = 300  # seconds
+    RESPONSE_CACHE_SIZE = 1024
+    
+    def __init__(self, provider: str = "ollama", client: Optional[httpx.AsyncClient] = None):
         """
         Initialize LLM service.
         
         Args:
             provider: 'ollama' for local or 'groq' for cloud
+            client: HTTP client to use (defaults to the shared client)
         """
         self.provider = provider
+        self.client = client
         self.ollama_url = os.getenv("OLLAMA_URL", "http://localhost:11434")
         self.ollama_model = os.getenv("OLLAMA_MODEL", "llama3.2")
         self.groq_api_key = os.getenv("GROQ_API_KEY", "")
         self.groq_model = "llama-3.1-8b-instant"
+        self._response_cache: TTLCache[str] = TTLCache(self.RESPONSE_CACHE_TTL, self.RESPONSE_CACHE_SIZE)
+        # Running LLM calls keyed by a blake2b digest of the prompt, so large
+        # prompts are not held twice
+        self._inflight: dict[bytes, asyncio.Task[str]] = {}
     
     async def extract_intent(self, query: str, language: str = "en") -> IntentResult:
         """
@@ -108,7 +158,7 @@ JSON response:"""
             response = await self._call_llm(prompt)
             # Parse JSON from response
             json_str = self._extract_json(response)
-            data = json.loads(json_str)
+            data = orjson.loads(json_str)
             
             return IntentResult(
                 intent=data.get("intent", "unclear"),
@@ -138,6 +188,71 @@ JSON response:"""
         Returns:
             Natural language response in the target language
         """
+        cache_key = self._response_cache_key(decision_data, language, farmer_name)
+        cached = self._response_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        prompt = self._build_response_prompt(decision_data, language, farmer_name)
+        
+        try:
+            response = await self._call_llm(prompt)
+            response_text = response.strip()
+            self._response_cache.set(cache_key, response_text)
+            return response_text
+        except Exception as e:
+            print(f"LLM response generation failed: {e}")
+            # Fallback to English template
+            return self._fallback_response(decision_data, farmer_name)
+    
+    async def stream_response(
+        self,
+        decision_data: dict,
+        language: str = "en",
+        farmer_name: str = ""
+    ) -> AsyncIterator[str]:
+        """
+        Stream a natural language response in the farmer's language.
+        
+        Same prompt and caching as generate_response, but yields text
+        chunks as the LLM produces them.
+        
+        Args:
+            decision_data: Data from agents (weather, crop stage, risks, etc.)
+            language: Target language code
+            farmer_name: Farmer's name for personalization
+            
+        Yields:
+            Response text chunks in the target language
+        """
+        cache_key = self._response_cache_key(decision_data, language, farmer_name)
+        cached = self._response_cache.get(cache_key)
+        if cached is not None:
+            yield cached
+            return
+        
+        prompt = self._build_response_prompt(decision_data, language, farmer_name)
+        chunks = []
+        
+        try:
+            async for chunk in self._stream_llm(prompt):
+                if not chunks:
+                    chunk = chunk.lstrip()
+                    if not chunk:
+                        continue
+                chunks.append(chunk)
+                yield chunk
+        except Exception as e:
+            print(f"LLM response streaming failed: {e}")
+            if not chunks:
+                # Fallback to English template
+                yield self._fallback_response(decision_data, farmer_name)
+            return
+        
+        self._response_cache.set(cache_key, "".join(chunks).strip())
+    
+    def _build_response_prompt(self, decision_data: dict, language: str, farmer_name: str) -> str:
+        """Build the response-generation prompt from decision data."""
         lang_name = self.LANGUAGES.get(language, "English")
         
         # Build context from decision data
@@ -192,14 +307,17 @@ Guidelines:
 6. Use emoji naturally (💧 🌾).
 
 Your response in {lang_name}:"""
-
-        try:
-            response = await self._call_llm(prompt)
-            return response.strip()
-        except Exception as e:
-            print(f"LLM response generation failed: {e}")
-            # Fallback to English template
-            return self._fallback_response(decision_data, farmer_name)
+        
+        return prompt
+    
+    def _response_cache_key(self, decision_data: dict, language: str, farmer_name: str) -> bytes:
+        """Hash of everything that shapes a generated response."""
+        canonical = orjson.dumps(
+            [decision_data, language, farmer_name],
+            option=orjson.OPT_SORT_KEYS,
+            default=str
+        )
+        return hashlib.blake2b(canonical, digest_size=16).digest()
     
     async def translate(self, text: str, target_language: str) -> str:
         """
@@ -210,11 +328,19 @@ Your response in {lang_name}:"""
             target_language: Target language code (hi, te, kn, etc.)
             
         Returns:
-            Translated text
+            Translated text (cached like generated responses)
         """
         if target_language == "en":
             return text
         
+        cache_key = hashlib.blake2b(
+            orjson.dumps(["translate", text, target_language]),
+            digest_size=16
+        ).digest()
+        cached = self._response_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         lang_name = self.LANGUAGES.get(target_language, "Hindi")
         
         prompt = f"""Translate this agricultural advice to {lang_name}. 
@@ -227,7 +353,9 @@ Translation in {lang_name}:"""
 
         try:
             response = await self._call_llm(prompt)
-            return response.strip()
+            translated = response.strip()
+            self._response_cache.set(cache_key, translated)
+            return translated
         except Exception as e:
             print(f"Translation failed: {e}")
             return text  # Return original if translation fails
@@ -235,7 +363,22 @@ Translation in {lang_name}:"""
     async def _call_llm(self, prompt: str) -> str:
         """
         Call the LLM backend (Ollama or Groq).
+        Concurrent calls with an identical prompt share one request.
         """
+        key = hashlib.blake2b(prompt.encode(), digest_size=16).digest()
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._dispatch_llm(prompt))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+            # Read the outcome here so a failure whose callers all went
+            # away is not logged as never retrieved
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        # Shielded so one caller going away does not cancel the others
+        return await asyncio.shield(task)
+    
+    async def _dispatch_llm(self, prompt: str) -> str:
+        """Send one prompt to the configured backend."""
         if self.provider == "groq" and self.groq_api_key:
             return await self._call_groq(prompt)
         else:
@@ -243,42 +386,113 @@ Translation in {lang_name}:"""
     
     async def _call_ollama(self, prompt: str) -> str:
         """Call Ollama API."""
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.post(
-                f"{self.ollama_url}/api/generate",
-                json={
-                    "model": self.ollama_model,
-                    "prompt": prompt,
-                    "stream": False,
-                    "options": {
-                        "temperature": 0.3,
-                        "num_predict": 500
-                    }
+        client = self.client or get_http_client()
+        response = await client.post(
+            f"{self.ollama_url}/api/generate",
+            json={
+                "model": self.ollama_model,
+                "prompt": prompt,
+                "stream": False,
+                "options": {
+                    "temperature": 0.3,
+                    "num_predict": 500
                 }
-            )
-            response.raise_for_status()
-            data = response.json()
-            return data.get("response", "")
+            },
+            timeout=60.0
+        )
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+        return data.get("response", "")
     
     async def _call_groq(self, prompt: str) -> str:
         """Call Groq API."""
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                "https://api.groq.com/openai/v1/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {self.groq_api_key}",
-                    "Content-Type": "application/json"
-                },
-                json={
-                    "model": self.groq_model,
-                    "messages": [{"role": "user", "content": prompt}],
+        client = self.client or get_http_client()
+        response = await client.post(
+            "https://api.groq.com/openai/v1/chat/completions",
+            headers={
+                "Authorization": f"Bearer {self.groq_api_key}",
+                "Content-Type": "application/json"
+            },
+            json={
+                "model": self.groq_model,
+                "messages": [{"role": "user", "content": prompt}],
+                "temperature": 0.3,
+                "max_tokens": 500
+            },
+            timeout=30.0
+        )
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+        return data["choices"][0]["message"]["content"]
+    
+    async def _stream_llm(self, prompt: str) -> AsyncIterator[str]:
+        """
+        Stream text chunks from the LLM backend (Ollama or Groq).
+        """
+        if self.provider == "groq" and self.groq_api_key:
+            stream = self._stream_groq(prompt)
+        else:
+            stream = self._stream_ollama(prompt)
+        
+        async for chunk in stream:
+            yield chunk
+    
+    async def _stream_ollama(self, prompt: str) -> AsyncIterator[str]:
+        """Stream from Ollama API (newline-delimited JSON)."""
+        client = self.client or get_http_client()
+        async with client.stream(
+            "POST",
+            f"{self.ollama_url}/api/generate",
+            json={
+                "model": self.ollama_model,
+                "prompt": prompt,
+                "stream": True,
+                "options": {
                     "temperature": 0.3,
-                    "max_tokens": 500
+                    "num_predict": 500
                 }
-            )
+            },
+            timeout=60.0
+        ) as response:
+            response.raise_for_status()
+            async for line in response.aiter_lines():
+                if not line:
+                    continue
+                data = orjson.loads(line)
+                if data.get("response"):
+                    yield data["response"]
+                if data.get("done"):
+                    break
+    
+    async def _stream_groq(self, prompt: str) -> AsyncIterator[str]:
+        """Stream from Groq API (server-sent events)."""
+        client = self.client or get_http_client()
+        async with client.stream(
+            "POST",
+            "https://api.groq.com/openai/v1/chat/completions",
+            headers={
+                "Authorization": f"Bearer {self.groq_api_key}",
+                "Content-Type": "application/json"
+            },
+            json={
+                "model": self.groq_model,
+                "messages": [{"role": "user", "content": prompt}],
+                "temperature": 0.3,
+                "max_tokens": 500,
+                "stream": True
+            },
+            timeout=30.0
+        ) as response:
             response.raise_for_status()
-            data = response.json()
-            return data["choices"][0]["message"]["content"]
+            async for line in response.aiter_lines():
+                if not line.startswith("data: "):
+                    continue
+                payload = line[len("data: "):]
+                if payload == "[DONE]":
+                    break
+                delta = orjson.loads(payload)["choices"][0].get("delta", {})
+                if delta.get("content"):
+                    yield delta["content"]
     
     def _extract_json(self, text: str) -> str:
         """Extract JSON from LLM response."""
@@ -317,32 +531,16 @@ Translation in {lang_name}:"""
         query_lower = query.lower()
         
         # Detect language
-        if any(c in query for c in "हिंदी मेरी फसल पानी"):
-            lang = "hi"
-        elif any(c in query for c in "తెలుగు నా పంట నీరు"):
-            lang = "te"
-        elif any(c in query for c in "ಕನ್ನಡ ನನ್ನ ಬೆಳೆ ನೀರು"):
-            lang = "kn"
-        else:
-            lang = "en"
+        lang = next(
+            (code for code, script in _LANGUAGE_SCRIPTS if script.search(query)),
+            "en"
+        )
         
         # Keyword matching
-        if any(w in query_lower for w in ["water", "irrigat", "पानी", "నీరు", "ನೀರು"]):
-            intent = "irrigation_query"
-        elif any(w in query_lower for w in ["weather", "rain", "मौसम", "వర్షం", "ಮಳೆ"]):
-            intent = "weather_query"
-        elif any(w in query_lower for w in ["status", "how is", "कैसी", "ఎలా", "ಹೇಗೆ", "stage"]):
-            intent = "crop_status_query"
-        elif any(w in query_lower for w in ["harvest", "ready", "कटाई", "పంట కోత"]):
-            intent = "harvest_query"
-        elif any(w in query_lower for w in ["pest", "disease", "insect", "कीट", "పురుగు"]):
-            intent = "pest_disease_query"
-        elif any(w in query_lower for w in ["fertiliz", "खाद", "ఎరువు", "urea", "dap"]):
-            intent = "fertilizer_query"
-        elif any(w in query_lower for w in ["hello", "hi", "नमस्ते", "హలో"]):
-            intent = "greeting"
-        else:
-            intent = "general_farming"
+        intent = next(
+            (intent for intent, pattern in _INTENT_PATTERNS if pattern.search(query_lower)),
+            "general_farming"
+        )
         
         return IntentResult(
             intent=intent,
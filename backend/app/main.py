@@ -13,6 +13,7 @@ from dotenv import load_dotenv
 load_dotenv()
 
 from .database import init_db, close_db
+from .utils.http import close_http_client
 from .routers import auth as auth_router
 from .routers import profile as profile_router
 from .routers import interaction as interaction_router
@@ -31,6 +32,7 @@ async def lifespan(app: FastAPI):
     yield
     # Shutdown
     await close_db()
+    await close_http_client()
     print("👋 Shutdown complete")
 
 
@@ -214,7 +214,11 @@ class ChatMessage(BaseModel):
 
 
 class ChatResponse(BaseModel):
-    """Schema for chat response with reasoning."""
+    """
+    Schema for chat response with reasoning.
+    Built unvalidated by the orchestrator; the /chat route's response_model
+    validates it once on the way out.
+    """
     response: str
     confidence: float
     reasoning: str
@@ -223,7 +227,11 @@ class ChatResponse(BaseModel):
 
 
 class AgentResponse(BaseModel):
-    """Standard response format from all agents."""
+    """
+    Standard response format from all agents.
+    Agents build it with model_construct() since the payload is internal;
+    validation happens at the API boundary.
+    """
     result: dict
     confidence: float = Field(..., ge=0, le=1)
     reasoning: str
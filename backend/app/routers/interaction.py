@@ -3,18 +3,23 @@ Interaction router - Chat and advisory endpoints.
 Uses Decision Orchestrator for all query processing.
 """
 from fastapi import APIRouter, Depends, HTTPException, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from typing import Optional
-import json
+from datetime import date
+import orjson
 
-from ..database import get_db
+from ..database import get_db, async_session_maker
 from ..models import (
     ChatMessage, ChatResponse, ChatMessageDB,
     FarmerDB, CropDB, FarmDB
 )
 from ..auth import get_current_farmer_id
-from ..agents import DecisionOrchestrator
+from ..agents import get_orchestrator
+from ..utils.weather import get_weather, assess_farming_impact
+from ..utils.crop_data import get_stage_progress, get_crop_info
+from ..utils.gdd import estimate_gdd_from_average
 
 router = APIRouter()
 
@@ -22,6 +27,39 @@ router = APIRouter()
 connections: dict[int, WebSocket] = {}
 
 
+async def _load_farmer(
+    db: AsyncSession,
+    farmer_id: int
+) -> tuple[Optional[FarmerDB], Optional[FarmDB]]:
+    """Load farmer and farm in one joined query."""
+    result = await db.execute(
+        select(FarmerDB, FarmDB)
+        .outerjoin(FarmDB, FarmDB.farmer_id == FarmerDB.id)
+        .where(FarmerDB.id == farmer_id)
+    )
+    row = result.one_or_none()
+    
+    if not row:
+        return None, None
+    
+    farmer, farm = row
+    return farmer, farm
+
+
+async def _load_active_crops(db: AsyncSession, farm: Optional[FarmDB]) -> list[CropDB]:
+    """Load the farm's active crops."""
+    if not farm:
+        return []
+    
+    result = await db.execute(
+        select(CropDB).where(
+            CropDB.farm_id == farm.id,
+            CropDB.is_active == True
+        )
+    )
+    return result.scalars().all()
+
+
 @router.post("/chat", response_model=ChatResponse)
 async def process_chat_message(
     message: ChatMessage,
@@ -31,30 +69,17 @@ async def process_chat_message(
     Process a chat message through the Decision Orchestrator.
     Returns context-aware, data-backed response.
     """
-    # Get farmer context
-    result = await db.execute(
-        select(FarmerDB).where(FarmerDB.id == message.farmer_id)
-    )
-    farmer = result.scalar_one_or_none()
+    # Get farmer context and active crops
+    farmer, farm = await _load_farmer(db, message.farmer_id)
     
     if not farmer:
         raise HTTPException(status_code=404, detail="Farmer not found")
     
-    # Get active crops
-    result = await db.execute(
-        select(FarmDB).where(FarmDB.farmer_id == farmer.id)
-    )
-    farm = result.scalar_one_or_none()
-    
-    crops = []
-    if farm:
-        result = await db.execute(
-            select(CropDB).where(
-                CropDB.farm_id == farm.id,
-                CropDB.is_active == True
-            )
-        )
-        crops = result.scalars().all()
+    # Weather only needs the farmer's coordinates; let it run while the
+    # crops are loaded
+    orchestrator = get_orchestrator()
+    orchestrator.prefetch(farmer, message.content)
+    crops = await _load_active_crops(db, farm)
     
     # Store user message
     user_msg = ChatMessageDB(
@@ -65,7 +90,6 @@ async def process_chat_message(
     db.add(user_msg)
     
     # Process through Decision Orchestrator
-    orchestrator = DecisionOrchestrator()
     response = await orchestrator.process_query(
         farmer=farmer,
         farm=farm,
@@ -88,6 +112,71 @@ async def process_chat_message(
     return response
 
 
+@router.post("/chat/stream")
+async def stream_chat_message(
+    message: ChatMessage,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Streaming variant of /chat.
+    Returns newline-delimited JSON: one "meta" event (confidence, reasoning,
+    data_sources, alerts), then a "recommendation" event with the rule-based
+    recommendation, both sent before the LLM starts, followed by "token"
+    events with the response text. Bare greetings skip the recommendation.
+    """
+    farmer, farm = await _load_farmer(db, message.farmer_id)
+    
+    if not farmer:
+        raise HTTPException(status_code=404, detail="Farmer not found")
+    
+    # Weather only needs the farmer's coordinates; let it run while the
+    # crops are loaded and the user message is committed
+    orchestrator = get_orchestrator()
+    orchestrator.prefetch(farmer, message.content)
+    crops = await _load_active_crops(db, farm)
+    
+    # Store user message before streaming starts
+    user_msg = ChatMessageDB(
+        farmer_id=farmer.id,
+        role="user",
+        content=message.content
+    )
+    db.add(user_msg)
+    await db.commit()
+    
+    events = orchestrator.stream_query(
+        farmer=farmer,
+        farm=farm,
+        crops=crops,
+        query=message.content,
+        db=db
+    )
+    farmer_id = farmer.id
+    
+    async def ndjson():
+        reasoning = None
+        parts = []
+        async for event in events:
+            if event["type"] == "meta":
+                reasoning = event["reasoning"]
+            elif event["type"] == "token":
+                parts.append(event["content"])
+            yield orjson.dumps(event) + b"\n"
+        
+        # Store assistant response once complete. The request session may
+        # already be closed while the body streams, so use a fresh one.
+        async with async_session_maker() as session:
+            session.add(ChatMessageDB(
+                farmer_id=farmer_id,
+                role="assistant",
+                content="".join(parts),
+                intent=reasoning[:50] if reasoning else None
+            ))
+            await session.commit()
+    
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
+
 @router.websocket("/ws/chat/{farmer_id}")
 async def websocket_chat(
     websocket: WebSocket,
@@ -104,7 +193,7 @@ async def websocket_chat(
         while True:
             # Receive message
             data = await websocket.receive_text()
-            message_data = json.loads(data)
+            message_data = orjson.loads(data)
             
             # Create chat message
             message = ChatMessage(
@@ -113,33 +202,19 @@ async def websocket_chat(
             )
             
             # Process through orchestrator
-            # Get farmer context
-            result = await db.execute(
-                select(FarmerDB).where(FarmerDB.id == farmer_id)
-            )
-            farmer = result.scalar_one_or_none()
+            # Get farmer context, farm and crops
+            farmer, farm = await _load_farmer(db, farmer_id)
             
             if not farmer:
-                await websocket.send_json({
+                await websocket.send_text(orjson.dumps({
                     "error": "Farmer not found"
-                })
+                }).decode())
                 continue
             
-            # Get farm and crops
-            result = await db.execute(
-                select(FarmDB).where(FarmDB.farmer_id == farmer.id)
-            )
-            farm = result.scalar_one_or_none()
-            
-            crops = []
-            if farm:
-                result = await db.execute(
-                    select(CropDB).where(
-                        CropDB.farm_id == farm.id,
-                        CropDB.is_active == True
-                    )
-                )
-                crops = result.scalars().all()
+            # Weather runs while the crops are loaded
+            orchestrator = get_orchestrator()
+            orchestrator.prefetch(farmer, message.content)
+            crops = await _load_active_crops(db, farm)
             
             # Store user message
             user_msg = ChatMessageDB(
@@ -150,7 +225,6 @@ async def websocket_chat(
             db.add(user_msg)
             
             # Process
-            orchestrator = DecisionOrchestrator()
             response = await orchestrator.process_query(
                 farmer=farmer,
                 farm=farm,
@@ -169,13 +243,13 @@ async def websocket_chat(
             await db.commit()
             
             # Send response
-            await websocket.send_json({
+            await websocket.send_text(orjson.dumps({
                 "response": response.response,
                 "confidence": response.confidence,
                 "reasoning": response.reasoning,
                 "data_sources": response.data_sources,
                 "alerts": response.alerts
-            })
+            }).decode())
             
     except WebSocketDisconnect:
         if farmer_id in connections:
@@ -188,8 +262,6 @@ async def get_farmer_weather(
     db: AsyncSession = Depends(get_db)
 ):
     """Get current weather for farmer's location."""
-    from ..utils.weather import fetch_weather, assess_farming_impact
-    
     result = await db.execute(
         select(FarmerDB).where(FarmerDB.id == farmer_id)
     )
@@ -198,7 +270,7 @@ async def get_farmer_weather(
     if not farmer or not farmer.latitude or not farmer.longitude:
         raise HTTPException(status_code=404, detail="Farmer location not found")
     
-    weather = await fetch_weather(farmer.latitude, farmer.longitude)
+    weather = await get_weather(farmer.latitude, farmer.longitude)
     impact = assess_farming_impact(weather)
     
     return {
@@ -214,11 +286,6 @@ async def get_crop_status(
     db: AsyncSession = Depends(get_db)
 ):
     """Get current status of farmer's crops."""
-    from ..utils.crop_data import get_stage_progress, get_crop_info
-    from ..utils.gdd import estimate_gdd_from_average
-    from ..utils.weather import fetch_weather
-    from datetime import date
-    
     # Get farmer
     result = await db.execute(
         select(FarmerDB).where(FarmerDB.id == farmer_id)
@@ -246,21 +313,25 @@ async def get_crop_status(
     weather = None
     if farmer.latitude and farmer.longitude:
         try:
-            weather = await fetch_weather(farmer.latitude, farmer.longitude)
+            weather = await get_weather(farmer.latitude, farmer.longitude)
         except:
             pass
     
+    today = date.today()
+    has_forecast = bool(weather and weather.forecast_7day)
+    if has_forecast:
+        avg_max, avg_min = weather.mean_temperatures()
+    
     crop_statuses = []
     for crop in crops:
         # Estimate GDD if we have weather
-        if weather and weather.forecast_7day:
-            avg_max = sum(f.temp_max for f in weather.forecast_7day) / len(weather.forecast_7day)
-            avg_min = sum(f.temp_min for f in weather.forecast_7day) / len(weather.forecast_7day)
+        if has_forecast:
             gdd_result = estimate_gdd_from_average(
                 crop.sowing_date,
                 avg_max,
                 avg_min,
-                crop.crop_type
+                crop.crop_type,
+                current_date=today
             )
             accumulated_gdd = gdd_result.accumulated_gdd
         else:
@@ -274,7 +345,7 @@ async def get_crop_status(
             "id": crop.id,
             "crop_type": crop.crop_type,
             "sowing_date": crop.sowing_date.isoformat(),
-            "days_since_sowing": (date.today() - crop.sowing_date).days,
+            "days_since_sowing": (today - crop.sowing_date).days,
             "accumulated_gdd": accumulated_gdd,
             "stage": progress.get("current_stage", "unknown"),
             "stage_progress": progress.get("stage_progress", 0),
@@ -13,6 +13,7 @@ from ..models import (
     OnboardingRequest
 )
 from ..auth import get_current_user, TokenData, create_access_token
+from ..utils.crop_data import get_available_crops as list_available_crops
 
 router = APIRouter()
 
@@ -55,32 +56,28 @@ async def complete_onboarding(
         longitude=request.longitude,
         location_name=request.location_name
     )
-    db.add(farmer)
-    await db.flush()  # Get farmer ID
     
-    # Create farm
+    # Create farm and first crop linked through the relationships, so the
+    # unit of work fills in the foreign keys and all three rows go out in
+    # the single flush at commit
     farm = FarmDB(
-        farmer_id=farmer.id,
+        farmer=farmer,
         name="My Farm",
         land_size_acres=request.land_size_acres,
         irrigation_type=request.irrigation_type.value
     )
-    db.add(farm)
-    await db.flush()  # Get farm ID
     
-    # Create first crop
     crop = CropDB(
-        farm_id=farm.id,
+        farm=farm,
         crop_type=request.crop_type.lower(),
         sowing_date=request.sowing_date,
         current_stage="germination"
     )
-    db.add(crop)
+    db.add_all([farmer, farm, crop])
     
+    # Ids are assigned at flush and the session keeps attributes after
+    # commit, so no refresh round trips are needed
     await db.commit()
-    await db.refresh(farmer)
-    await db.refresh(farm)
-    await db.refresh(crop)
     
     # Generate new token with farmer_id
     new_token = create_access_token({
@@ -160,7 +157,6 @@ async def basic_onboarding(
             existing_farmer.name = request.name
         
         await db.commit()
-        await db.refresh(existing_farmer)
         
         new_token = create_access_token({
             "sub": request.phone,
@@ -185,7 +181,6 @@ async def basic_onboarding(
     )
     db.add(farmer)
     await db.commit()
-    await db.refresh(farmer)
     
     # Generate token with farmer_id
     new_token = create_access_token({
@@ -303,5 +298,4 @@ async def get_farmer_crops(
 @router.get("/crops/available")
 async def get_available_crops():
     """Get list of crops supported by the system."""
-    from ..utils.crop_data import get_available_crops
-    return {"crops": get_available_crops()}
+    return {"crops": list_available_crops()}
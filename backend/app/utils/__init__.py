@@ -1,14 +1,21 @@
 """Utils package for Agricultural Decision Support System."""
-from .weather import fetch_weather, assess_farming_impact, WeatherData, FarmingImpact
+from .weather import fetch_weather, fetch_weather_batch, get_weather, prefetch_weather, weather_batcher, assess_farming_impact, forecast_stats, WeatherData, FarmingImpact
+from .cache import TTLCache
 from .gdd import calculate_daily_gdd, calculate_accumulated_gdd, estimate_gdd_from_average, GDDResult
 
 __all__ = [
     "fetch_weather",
+    "fetch_weather_batch",
+    "get_weather",
+    "prefetch_weather",
+    "weather_batcher",
     "assess_farming_impact",
+    "forecast_stats",
     "WeatherData",
     "FarmingImpact",
     "calculate_daily_gdd",
     "calculate_accumulated_gdd",
     "estimate_gdd_from_average",
     "GDDResult",
+    "TTLCache",
 ]
@@ -0,0 +1,60 @@
+"""
+In-process TTL + LRU cache shared by the weather, LLM and auth layers.
+"""
+import time
+from collections import OrderedDict
+from typing import Generic, Hashable, Optional, TypeVar
+
+V = TypeVar("V")
+
+
+class TTLCache(Generic[V]):
+    """
+    Mapping whose entries expire ttl seconds after they are stored,
+    holding at most maxsize entries.
+    
+    Entries are kept least recently used first. Storing a value drops
+    expired entries from the front and then evicts the least recently
+    used until the cache fits; an expired entry is also dropped when read.
+    """
+    
+    def __init__(self, ttl: float, maxsize: int):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        # Key -> (expires_at, value) with expires_at from time.monotonic()
+        self._entries: OrderedDict[Hashable, tuple[float, V]] = OrderedDict()
+    
+    def get(self, key: Hashable) -> Optional[V]:
+        """Return the value for key, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+        
+        self._entries.move_to_end(key)
+        return value
+    
+    def set(self, key: Hashable, value: V, ttl: Optional[float] = None):
+        """Store value for key, expiring after ttl seconds (default self.ttl)."""
+        now = time.monotonic()
+        self._entries[key] = (now + (self.ttl if ttl is None else ttl), value)
+        self._entries.move_to_end(key)
+        
+        while self._entries:
+            expires_at, _ = next(iter(self._entries.values()))
+            if expires_at > now and len(self._entries) <= self.maxsize:
+                break
+            self._entries.popitem(last=False)
+    
+    def pop(self, key: Hashable) -> Optional[V]:
+        """Remove key and return its value, or None if missing or expired."""
+        value = self.get(key)
+        self._entries.pop(key, None)
+        return value
+    
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -61,8 +61,13 @@ def load_crop_data() -> dict:
         return json.load(f)
 
 
+@lru_cache(maxsize=64)
 def get_crop_info(crop_type: str) -> Optional[CropInfo]:
-    """Get information about a specific crop type."""
+    """
+    Get information about a specific crop type.
+    Cached per crop_type since the knowledge base is static; treat the
+    returned model as read-only.
+    """
     data = load_crop_data()
     crop_key = crop_type.lower().replace(" ", "_").replace("-", "_")
     
@@ -154,10 +159,11 @@ def get_stage_progress(crop_type: str, accumulated_gdd: float) -> dict:
     }
 
 
-def get_risk_rules() -> list[RiskRule]:
-    """Get all risk assessment rules."""
+@lru_cache(maxsize=1)
+def get_risk_rules() -> tuple[RiskRule, ...]:
+    """Get all risk assessment rules. Cached for performance."""
     data = load_crop_data()
-    return [RiskRule(**rule) for rule in data.get("risk_rules", [])]
+    return tuple(RiskRule(**rule) for rule in data.get("risk_rules", []))
 
 
 def get_spray_conditions() -> dict:
@@ -125,16 +125,14 @@ def calculate_accumulated_gdd(
     """
     base_temp = get_base_temperature(crop_type)
     accumulated = 0.0
+    today_gdd = 0.0
     
+    # Single pass: the last iteration leaves today's contribution in today_gdd
     for temp_max, temp_min in daily_temps:
-        accumulated += calculate_daily_gdd(temp_max, temp_min, base_temp)
+        today_gdd = calculate_daily_gdd(temp_max, temp_min, base_temp)
+        accumulated += today_gdd
     
     days = len(daily_temps)
-    today_gdd = calculate_daily_gdd(
-        daily_temps[-1][0],
-        daily_temps[-1][1],
-        base_temp
-    ) if daily_temps else 0.0
     
     return GDDResult(
         accumulated_gdd=round(accumulated, 2),
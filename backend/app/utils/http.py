@@ -0,0 +1,33 @@
+"""
+Shared HTTP client for outbound API calls (Open-Meteo, Ollama, Groq).
+Reusing one pooled client keeps connections alive between requests
+instead of paying a new TCP/TLS handshake on every call.
+"""
+import httpx
+from typing import Optional
+
+
+# Default timeout for outbound calls; callers may override per request
+DEFAULT_TIMEOUT = 10.0
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get or create the shared HTTP client."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            http2=True,
+            timeout=DEFAULT_TIMEOUT,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64)
+        )
+    return _client
+
+
+async def close_http_client():
+    """Close the shared HTTP client (called on application shutdown)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
@@ -2,12 +2,17 @@
 Weather service using Open-Meteo API.
 Free, no API key required.
 """
+import asyncio
 import httpx
-from datetime import datetime, date
+import orjson
+from datetime import date
 from typing import Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 from enum import Enum
 
+from .cache import TTLCache
+from .http import get_http_client
+
 
 class WeatherCondition(str, Enum):
     """Weather condition categories for farming."""
@@ -41,6 +46,42 @@ class DailyForecast(BaseModel):
     condition: WeatherCondition
 
 
+def forecast_stats(forecast: list[dict]) -> dict:
+    """
+    Aggregates over agent forecast rows (see WeatherData.to_agent_payload),
+    taken in one pass: mean and extreme temperatures, peak rain
+    probability and total precipitation. Means are None for no rows.
+    """
+    total_max = total_min = 0.0
+    max_temp_max = float("-inf")
+    min_temp_min = float("inf")
+    max_rain_prob = 0
+    total_rain = 0.0
+    for f in forecast:
+        temp_max = f.get("temp_max", 0)
+        temp_min = f.get("temp_min", 10)
+        rain_probability = f.get("rain_probability", 0)
+        total_max += temp_max
+        total_min += temp_min
+        if temp_max > max_temp_max:
+            max_temp_max = temp_max
+        if temp_min < min_temp_min:
+            min_temp_min = temp_min
+        if rain_probability > max_rain_prob:
+            max_rain_prob = rain_probability
+        total_rain += f.get("precipitation", 0)
+    
+    n = len(forecast)
+    return {
+        "avg_temp_max": total_max / n if n else None,
+        "avg_temp_min": total_min / n if n else None,
+        "max_temp_max": max_temp_max,
+        "min_temp_min": min_temp_min,
+        "max_rain_prob": max_rain_prob,
+        "total_rain": total_rain
+    }
+
+
 class WeatherData(BaseModel):
     """Complete weather data for a location."""
     latitude: float
@@ -48,6 +89,54 @@ class WeatherData(BaseModel):
     current: CurrentWeather
     forecast_7day: list[DailyForecast]
     timezone: str
+    
+    _payload: Optional[dict] = PrivateAttr(default=None)
+    _mean_temps: Optional[tuple[float, float]] = PrivateAttr(default=None)
+    
+    def to_agent_payload(self) -> dict:
+        """
+        Compact current + 3-day forecast dict used by the agents, with the
+        forecast aggregates precomputed under "forecast_stats".
+        Built on first call and reused for the lifetime of this object.
+        """
+        if self._payload is None:
+            current = self.current
+            forecast = [
+                {
+                    "date": f.date.isoformat(),
+                    "temp_max": f.temp_max,
+                    "temp_min": f.temp_min,
+                    "precipitation": f.precipitation_sum,
+                    "rain_probability": f.precipitation_probability
+                }
+                for f in self.forecast_7day[:3]
+            ]
+            self._payload = {
+                "current": {
+                    "temperature": current.temperature,
+                    "humidity": current.humidity,
+                    "precipitation": current.precipitation,
+                    "condition": current.condition.value,
+                    "wind_speed": current.wind_speed
+                },
+                "forecast_3day": forecast,
+                "forecast_stats": forecast_stats(forecast)
+            }
+        return self._payload
+    
+    def mean_temperatures(self) -> tuple[float, float]:
+        """
+        Average (temp_max, temp_min) over the 7-day forecast.
+        Both sums are taken in one pass and memoized on the object.
+        """
+        if self._mean_temps is None:
+            total_max = total_min = 0.0
+            for f in self.forecast_7day:
+                total_max += f.temp_max
+                total_min += f.temp_min
+            n = len(self.forecast_7day)
+            self._mean_temps = (total_max / n, total_min / n)
+        return self._mean_temps
 
 
 class FarmingImpact(BaseModel):
@@ -84,40 +173,32 @@ def _wmo_to_condition(wmo_code: int) -> WeatherCondition:
     return WeatherCondition.CLOUDY
 
 
-async def fetch_weather(latitude: float, longitude: float) -> WeatherData:
-    """
-    Fetch current weather and 7-day forecast from Open-Meteo.
-    No API key required.
-    """
-    params = {
-        "latitude": latitude,
-        "longitude": longitude,
-        "current": [
-            "temperature_2m",
-            "relative_humidity_2m",
-            "precipitation",
-            "weather_code",
-            "cloud_cover",
-            "wind_speed_10m",
-            "is_day"
-        ],
-        "daily": [
-            "weather_code",
-            "temperature_2m_max",
-            "temperature_2m_min",
-            "precipitation_sum",
-            "precipitation_probability_max",
-            "wind_speed_10m_max"
-        ],
-        "timezone": "auto",
-        "forecast_days": 7
-    }
-    
-    async with httpx.AsyncClient() as client:
-        response = await client.get(f"{OPEN_METEO_BASE}/forecast", params=params)
-        response.raise_for_status()
-        data = response.json()
-    
+# Variables requested from the forecast endpoint
+FORECAST_PARAMS = {
+    "current": [
+        "temperature_2m",
+        "relative_humidity_2m",
+        "precipitation",
+        "weather_code",
+        "cloud_cover",
+        "wind_speed_10m",
+        "is_day"
+    ],
+    "daily": [
+        "weather_code",
+        "temperature_2m_max",
+        "temperature_2m_min",
+        "precipitation_sum",
+        "precipitation_probability_max",
+        "wind_speed_10m_max"
+    ],
+    "timezone": "auto",
+    "forecast_days": 7
+}
+
+
+def _parse_forecast(data: dict, latitude: float, longitude: float) -> WeatherData:
+    """Convert one Open-Meteo forecast response object to WeatherData."""
     # Parse current weather
     current = data.get("current", {})
     current_weather = CurrentWeather(
@@ -130,21 +211,33 @@ async def fetch_weather(latitude: float, longitude: float) -> WeatherData:
         is_day=bool(current.get("is_day", 1))
     )
     
-    # Parse 7-day forecast
+    # Parse 7-day forecast, walking the daily columns side by side
     daily = data.get("daily", {})
-    forecast = []
     dates = daily.get("time", [])
+    columns = zip(
+        dates,
+        daily.get("temperature_2m_max", [0]),
+        daily.get("temperature_2m_min", [0]),
+        daily.get("precipitation_sum", [0]),
+        daily.get("precipitation_probability_max", [0]),
+        daily.get("wind_speed_10m_max", [0]),
+        daily.get("weather_code", [0]),
+        strict=True
+    ) if dates else ()
     
-    for i, date_str in enumerate(dates):
-        forecast.append(DailyForecast(
-            date=datetime.strptime(date_str, "%Y-%m-%d").date(),
-            temp_max=daily.get("temperature_2m_max", [0])[i],
-            temp_min=daily.get("temperature_2m_min", [0])[i],
-            precipitation_sum=daily.get("precipitation_sum", [0])[i],
-            precipitation_probability=daily.get("precipitation_probability_max", [0])[i],
-            wind_speed_max=daily.get("wind_speed_10m_max", [0])[i],
-            condition=_wmo_to_condition(daily.get("weather_code", [0])[i])
-        ))
+    forecast = [
+        DailyForecast(
+            date=date.fromisoformat(date_str),
+            temp_max=temp_max,
+            temp_min=temp_min,
+            precipitation_sum=precipitation_sum,
+            precipitation_probability=precipitation_probability,
+            wind_speed_max=wind_speed_max,
+            condition=_wmo_to_condition(weather_code)
+        )
+        for (date_str, temp_max, temp_min, precipitation_sum,
+             precipitation_probability, wind_speed_max, weather_code) in columns
+    ]
     
     return WeatherData(
         latitude=data.get("latitude", latitude),
@@ -155,11 +248,215 @@ async def fetch_weather(latitude: float, longitude: float) -> WeatherData:
     )
 
 
+async def fetch_weather(
+    latitude: float,
+    longitude: float,
+    client: Optional[httpx.AsyncClient] = None
+) -> WeatherData:
+    """
+    Fetch current weather and 7-day forecast from Open-Meteo.
+    No API key required.
+    """
+    params = {"latitude": latitude, "longitude": longitude, **FORECAST_PARAMS}
+    
+    client = client or get_http_client()
+    response = await client.get(f"{OPEN_METEO_BASE}/forecast", params=params)
+    response.raise_for_status()
+    data = orjson.loads(response.content)
+    
+    return _parse_forecast(data, latitude, longitude)
+
+
+async def fetch_weather_batch(
+    coordinates: list[tuple[float, float]],
+    client: Optional[httpx.AsyncClient] = None
+) -> list[WeatherData]:
+    """
+    Fetch weather for several locations in a single Open-Meteo request.
+    Open-Meteo accepts comma-separated coordinates and returns one
+    response object per location, in the same order.
+    """
+    params = {
+        "latitude": ",".join(str(lat) for lat, _ in coordinates),
+        "longitude": ",".join(str(lon) for _, lon in coordinates),
+        **FORECAST_PARAMS
+    }
+    
+    client = client or get_http_client()
+    response = await client.get(f"{OPEN_METEO_BASE}/forecast", params=params)
+    response.raise_for_status()
+    data = orjson.loads(response.content)
+    
+    # A single location comes back as an object rather than a list
+    if isinstance(data, dict):
+        data = [data]
+    
+    return [
+        _parse_forecast(item, lat, lon)
+        for item, (lat, lon) in zip(data, coordinates)
+    ]
+
+
+class WeatherBatcher:
+    """
+    Coalesces concurrent weather lookups into batched Open-Meteo requests.
+    
+    Calls to fetch() made within window_seconds of each other share one
+    HTTP round trip (up to max_batch locations per request). If a batched
+    request fails, each of its locations is retried on its own, so one bad
+    location only fails its own callers.
+    """
+    
+    def __init__(self, window_seconds: float = 0.02, max_batch: int = 50):
+        self.window_seconds = window_seconds
+        self.max_batch = max_batch
+        self._pending: list[tuple[float, float, asyncio.Future]] = []
+        self._flush_task: Optional[asyncio.Task] = None
+        # Batches being sent; the event loop only keeps weak references
+        self._send_tasks: set[asyncio.Task] = set()
+    
+    async def fetch(self, latitude: float, longitude: float) -> WeatherData:
+        """Queue a lookup and wait for the batch containing it."""
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((latitude, longitude, future))
+        
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_after_window())
+        
+        return await future
+    
+    async def _flush_after_window(self):
+        """Wait for more lookups to arrive, then send the batch."""
+        await asyncio.sleep(self.window_seconds)
+        self._flush_task = None
+        self._flush()
+    
+    def _flush(self):
+        """Send all pending lookups as one request."""
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.create_task(self._send(batch))
+            self._send_tasks.add(task)
+            task.add_done_callback(self._send_tasks.discard)
+    
+    async def _send(self, batch: list[tuple[float, float, asyncio.Future]]):
+        """Fetch a batch and resolve each caller's future."""
+        try:
+            results = await fetch_weather_batch([(lat, lon) for lat, lon, _ in batch])
+            if len(results) != len(batch):
+                raise ValueError(f"Expected {len(batch)} locations, got {len(results)}")
+        except Exception as e:
+            if len(batch) == 1:
+                self._resolve(batch[0][2], error=e)
+            else:
+                await asyncio.gather(*(self._send_one(*item) for item in batch))
+            return
+        
+        for (_, _, future), weather in zip(batch, results):
+            self._resolve(future, weather)
+    
+    async def _send_one(self, latitude: float, longitude: float, future: asyncio.Future):
+        """Fetch a single location from a failed batch."""
+        if future.done():
+            return
+        try:
+            weather = await fetch_weather(latitude, longitude)
+        except Exception as e:
+            self._resolve(future, error=e)
+        else:
+            self._resolve(future, weather)
+    
+    @staticmethod
+    def _resolve(
+        future: asyncio.Future,
+        weather: Optional[WeatherData] = None,
+        error: Optional[Exception] = None
+    ):
+        """Complete a caller's future unless it was already cancelled."""
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(weather)
+
+
+# Shared batcher for agent weather lookups
+weather_batcher = WeatherBatcher()
+
+
+# Forecasts keyed by (lat, lon) rounded to 2 decimals (~1 km grid). This is
+# the one weather cache: the chat agents and the weather/crop-status
+# endpoints all read through get_weather.
+WEATHER_CACHE_TTL = 900  # seconds
+WEATHER_CACHE_SIZE = 4096
+_weather_cache: TTLCache[WeatherData] = TTLCache(WEATHER_CACHE_TTL, WEATHER_CACHE_SIZE)
+# Fetch currently running per location; concurrent callers await the same task
+_weather_inflight: dict[tuple[float, float], asyncio.Task[WeatherData]] = {}
+
+
+def _weather_key(latitude: float, longitude: float) -> tuple[float, float]:
+    """Cache key for a location."""
+    return (round(latitude, 2), round(longitude, 2))
+
+
+def _weather_task(latitude: float, longitude: float) -> asyncio.Task[WeatherData]:
+    """
+    Running fetch for a location, started if there is none.
+    One fetch per location at a time; concurrent callers share its
+    outcome, including a failure, instead of retrying one by one.
+    """
+    key = _weather_key(latitude, longitude)
+    task = _weather_inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_fetch_and_cache(key, latitude, longitude))
+        _weather_inflight[key] = task
+        task.add_done_callback(lambda _: _weather_inflight.pop(key, None))
+        # Read the outcome here so a failure nobody awaited (an unjoined
+        # prefetch, a cancelled weather node) is not logged as never retrieved
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+    return task
+
+
+async def _fetch_and_cache(key: tuple[float, float], latitude: float, longitude: float) -> WeatherData:
+    """Fetch one location through weather_batcher and cache the result."""
+    weather = await weather_batcher.fetch(latitude, longitude)
+    _weather_cache.set(key, weather)
+    return weather
+
+
+async def get_weather(latitude: float, longitude: float) -> WeatherData:
+    """
+    Current weather and 7-day forecast, reused for WEATHER_CACHE_TTL seconds
+    per location. Misses go through weather_batcher, one fetch per location
+    at a time.
+    """
+    weather = _weather_cache.get(_weather_key(latitude, longitude))
+    if weather is not None:
+        return weather
+    
+    # Shielded so one caller going away does not cancel the others
+    return await asyncio.shield(_weather_task(latitude, longitude))
+
+
+def prefetch_weather(latitude: float, longitude: float):
+    """
+    Start fetching weather for a location without waiting for it.
+    A later get_weather() for the same location joins the running fetch
+    or reads the cached result.
+    """
+    if _weather_cache.get(_weather_key(latitude, longitude)) is None:
+        _weather_task(latitude, longitude)
+
+
 async def fetch_historical_weather(
     latitude: float,
     longitude: float,
     start_date: date,
-    end_date: date
+    end_date: date,
+    client: Optional[httpx.AsyncClient] = None
 ) -> list[dict]:
     """
     Fetch historical weather data for GDD calculation.
@@ -174,10 +471,10 @@ async def fetch_historical_weather(
         "timezone": "auto"
     }
     
-    async with httpx.AsyncClient() as client:
-        response = await client.get(f"{OPEN_METEO_BASE}/archive", params=params)
-        response.raise_for_status()
-        data = response.json()
+    client = client or get_http_client()
+    response = await client.get(f"{OPEN_METEO_BASE}/archive", params=params)
+    response.raise_for_status()
+    data = orjson.loads(response.content)
     
     daily = data.get("daily", {})
     dates = daily.get("time", [])